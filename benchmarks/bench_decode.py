@@ -0,0 +1,73 @@
+import sys
+import time
+
+"""
+Compare the pure Python register decode and encode against the viper
+versions in qwstpad_native, both on their own and through read_buttons_mask().
+
+The viper versions need a port with a native emitter, such as the MicroPython
+unix port: micropython benchmarks/bench_decode.py
+Run from the root of the repository. On CPython only the pure Python path is measured.
+"""
+
+sys.path.insert(0, "src")
+try:
+    import micropython  # noqa: F401
+except ImportError:
+    import types
+    sys.modules["micropython"] = types.ModuleType("micropython")
+    sys.modules["micropython"].const = lambda x: x
+
+import qwstpad
+from qwstpad import QwSTPad
+
+# Constants
+ITERATIONS = 100_000
+
+try:
+    ticks_us, ticks_diff = time.ticks_us, time.ticks_diff
+except AttributeError:
+    def ticks_us():
+        return time.perf_counter_ns() // 1000
+
+    def ticks_diff(a, b):
+        return a - b
+
+
+class NullI2C:
+    def readfrom_mem_into(self, address, reg, buffer):
+        pass
+
+    def writeto_mem(self, address, reg, buffer):
+        pass
+
+
+def per_call_us(func):
+    start = ticks_us()
+    for i in range(ITERATIONS):
+        func(i & 0xFFFF)
+    return ticks_diff(ticks_us(), start) / ITERATIONS
+
+
+def measure(decode, encode):
+    buffer = bytearray(2)
+    qwstpad._decode, qwstpad._encode = decode, encode
+    pad = QwSTPad(NullI2C(), show_address=False)
+    return (per_call_us(lambda state: decode(low, high, state)),
+            per_call_us(lambda value: encode(buffer, value)),
+            per_call_us(lambda _: pad.read_buttons_mask()))
+
+
+low, high = qwstpad._build_remap(tuple(QwSTPad.BUTTON_MAPPING.values()))
+paths = [("Python", qwstpad._py_decode, qwstpad._py_encode)]
+try:
+    import qwstpad_native
+    paths.append(("Viper", qwstpad_native.decode, qwstpad_native.encode))
+except (AttributeError, ImportError, SyntaxError, ValueError):
+    print("Viper: not supported by this port")
+
+for name, decode, encode in paths:
+    decode_us, encode_us, read_us = measure(decode, encode)
+    print(f"{name} decode:             {decode_us:.3f} us/call")
+    print(f"{name} encode:             {encode_us:.3f} us/call")
+    print(f"{name} read_buttons_mask:  {read_us:.3f} us/call")
@@ -0,0 +1,76 @@
+import sys
+import time
+import types
+
+"""
+Compare the cost of encoding the LED output word with the original per-LED
+bit loop against the precomputed table used by QwSTPad.
+
+Run from the root of the repository with: python benchmarks/bench_leds.py
+"""
+
+sys.path.insert(0, "src")
+if "micropython" not in sys.modules:
+    sys.modules["micropython"] = types.ModuleType("micropython")
+    sys.modules["micropython"].const = lambda x: x
+
+from qwstpad import NUM_LEDS, QwSTPad, _build_led_outputs
+
+# Constants
+ITERATIONS = 100_000
+
+
+class NullI2C:
+    def readfrom_mem_into(self, address, reg, buffer):
+        pass
+
+    def writeto_mem(self, address, reg, buffer):
+        pass
+
+
+class BitLoopEncoder:
+    # The encoder QwSTPad used before the lookup table
+    def __init__(self):
+        self.led_states = 0
+
+    def encode(self):
+        output = 0
+        for i in range(NUM_LEDS):
+            output = self.change_bit(output, QwSTPad.LED_MAPPING[i], not self.get_bit(self.led_states, i))
+        return output
+
+    def get_bit(self, num, bit_pos):
+        return (num & (1 << bit_pos)) != 0
+
+    def change_bit(self, num, bit_pos, state):
+        return num | (1 << bit_pos) if state else num & ~(1 << bit_pos)
+
+
+def per_call_us(func):
+    start = time.perf_counter()
+    for i in range(ITERATIONS):
+        func(i & 0b1111)
+    return (time.perf_counter() - start) * 1_000_000 / ITERATIONS
+
+
+def bit_loop(states):
+    encoder.led_states = states
+    encoder.encode()
+
+
+def table_lookup(states):
+    encoder.led_states = states
+    table[encoder.led_states]
+
+
+encoder = BitLoopEncoder()
+pad = QwSTPad(NullI2C(), show_address=False)
+table = _build_led_outputs(QwSTPad.LED_MAPPING)
+
+loop_us = per_call_us(bit_loop)
+table_us = per_call_us(table_lookup)
+set_leds_us = per_call_us(lambda states: pad.set_leds(states, force=True))
+
+print(f"Bit loop encode:    {loop_us:.3f} us/call")
+print(f"Table encode:       {table_us:.3f} us/call ({loop_us / table_us:.1f}x faster)")
+print(f"set_leds(force):    {set_leds_us:.3f} us/call")
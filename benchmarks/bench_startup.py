@@ -0,0 +1,51 @@
+import gc
+import sys
+import time
+
+"""
+Measure how long importing qwstpad takes, and how much heap it leaves in use.
+
+Run from the root of the repository with: micropython benchmarks/bench_startup.py
+Pass a directory of precompiled files, such as build/mpy from 'make mpy', to
+import from there instead of src. On CPython the heap is measured with tracemalloc.
+"""
+
+sys.path.insert(0, sys.argv[1] if len(sys.argv) > 1 else "src")
+try:
+    import micropython  # noqa: F401
+except ImportError:
+    import types
+    sys.modules["micropython"] = types.ModuleType("micropython")
+    sys.modules["micropython"].const = lambda x: x
+
+try:
+    ticks_us, ticks_diff = time.ticks_us, time.ticks_diff
+except AttributeError:
+    def ticks_us():
+        return time.perf_counter_ns() // 1000
+
+    def ticks_diff(a, b):
+        return a - b
+
+try:
+    mem_alloc = gc.mem_alloc
+except AttributeError:
+    import tracemalloc
+    tracemalloc.start()
+
+    def mem_alloc():
+        return tracemalloc.get_traced_memory()[0]
+
+
+gc.collect()
+before = mem_alloc()
+start = ticks_us()
+import qwstpad
+
+elapsed = ticks_diff(ticks_us(), start)
+gc.collect()
+used = mem_alloc() - before
+
+print(f"Imported {qwstpad.__file__}")
+print(f"Import time:        {elapsed} us")
+print(f"Heap after import:  {used} bytes")
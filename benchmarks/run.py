@@ -0,0 +1,208 @@
+import gc
+import json
+import sys
+import time
+
+"""
+Benchmark the QwSTPad hot paths against the simulated TCA9555 in tests/tca9555.py,
+measuring time, bus transactions, bus bytes and heap allocations per call.
+
+Runs on CPython and on the unix port of MicroPython, from the root of the repository:
+
+    python3 benchmarks/run.py [--iterations N] [--budget FILE] [--output FILE]
+    micropython benchmarks/run.py
+
+The report is printed as JSON, and also written to --output if given. The exit
+status is 1 if any result exceeds its limit in the budget file.
+"""
+
+ROOT = __file__.rsplit("/", 2)[0] if __file__.count("/") >= 2 else "."
+sys.path.insert(0, ROOT + "/src")
+sys.path.insert(0, ROOT + "/tests")
+
+IMPLEMENTATION = sys.implementation.name
+MICROPYTHON = IMPLEMENTATION == "micropython"
+
+if not MICROPYTHON:
+    import tracemalloc
+    import types
+
+    # CPython has no micropython module, so provide the one function qwstpad needs from it
+    if "micropython" not in sys.modules:
+        sys.modules["micropython"] = types.ModuleType("micropython")
+        sys.modules["micropython"].const = lambda x: x
+
+from tca9555 import FakeI2C
+
+import qwstpad
+
+# Constants
+DEFAULT_ITERATIONS = 1000
+DEFAULT_BUDGET = ROOT + "/benchmarks/budgets.json"
+ALLOC_SAMPLES = 20      # The number of single calls sampled for CPython's allocation peak
+
+
+def parse_args(argv):
+    args = {"iterations": DEFAULT_ITERATIONS, "budget": DEFAULT_BUDGET, "output": None}
+    i = 1
+    while i < len(argv):
+        name = argv[i]
+        if name in ("--iterations", "--budget", "--output") and i + 1 < len(argv):
+            args[name[2:]] = int(argv[i + 1]) if name == "--iterations" else argv[i + 1]
+            i += 2
+        else:
+            raise SystemExit("Unrecognised option: " + name)
+    return args
+
+
+def timer_us():
+    if MICROPYTHON:
+        return time.ticks_us()
+    return time.perf_counter() * 1_000_000
+
+
+def elapsed_us(start):
+    if MICROPYTHON:
+        return time.ticks_diff(time.ticks_us(), start)
+    return timer_us() - start
+
+
+def alloc_bytes(call, iterations):
+    if MICROPYTHON:
+        # With the collector off, the growth in allocated heap is everything the calls allocated
+        gc.collect()
+        gc.disable()
+        try:
+            before = gc.mem_alloc()
+            for i in range(iterations):
+                call(i)
+            return (gc.mem_alloc() - before) / iterations
+        finally:
+            gc.enable()
+
+    # CPython can only report the peak, so take the worst single call
+    worst = 0
+    tracemalloc.start()
+    try:
+        for i in range(ALLOC_SAMPLES):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            call(i)
+            worst = max(worst, tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+    return worst
+
+
+def measure(setup, iterations):
+    i2c = FakeI2C(log=False)
+    call = setup(i2c)
+
+    # Warm up, so one-off costs such as building attribute caches are not counted
+    for i in range(4):
+        call(i)
+
+    i2c.reset_counts()
+    for i in range(iterations):
+        call(i)
+    transactions = i2c.transactions() / iterations
+    bus_bytes = (i2c.bytes_read + i2c.bytes_written) / iterations
+
+    start = timer_us()
+    for i in range(iterations):
+        call(i)
+    us = elapsed_us(start) / iterations
+
+    return {"us": round(us, 3),
+            "transactions": transactions,
+            "bus_bytes": bus_bytes,
+            "alloc_bytes": alloc_bytes(call, iterations)}
+
+
+# Benchmarks. Each takes a FakeI2C and returns the call to measure, which is passed the iteration number
+def construction(i2c):
+    return lambda i: qwstpad.QwSTPad(i2c)
+
+
+def address_code(i2c):
+    pad = qwstpad.QwSTPad(i2c)
+    return lambda i: pad.address_code()
+
+
+def read_buttons(i2c):
+    pad = qwstpad.QwSTPad(i2c)
+    i2c.press(qwstpad.DEFAULT_ADDRESS, 0xE, 0x1)
+    return lambda i: pad.read_buttons()
+
+
+def read_buttons_mask(i2c):
+    pad = qwstpad.QwSTPad(i2c)
+    i2c.press(qwstpad.DEFAULT_ADDRESS, 0xE, 0x1)
+    return lambda i: pad.read_buttons_mask()
+
+
+def set_leds(i2c):
+    pad = qwstpad.QwSTPad(i2c)
+    return lambda i: pad.set_leds(i & 0b1111)
+
+
+def set_leds_unchanged(i2c):
+    pad = qwstpad.QwSTPad(i2c)
+    return lambda i: pad.set_leds(pad.address_code())
+
+
+def set_led(i2c):
+    pad = qwstpad.QwSTPad(i2c)
+    return lambda i: pad.set_led(1, i & 1)
+
+
+def clear_leds(i2c):
+    pad = qwstpad.QwSTPad(i2c)
+    return lambda i: pad.clear_leds(force=True)
+
+
+BENCHMARKS = (construction, address_code, read_buttons, read_buttons_mask,
+              set_leds, set_leds_unchanged, set_led, clear_leds)
+
+
+def check(results, budget):
+    failures = []
+    for name, limits in budget.items():
+        if name not in results:
+            continue
+        for metric, limit in limits.items():
+            # A limit may be given separately for each Python implementation
+            if isinstance(limit, dict):
+                limit = limit.get(IMPLEMENTATION)
+            if limit is not None and results[name][metric] > limit:
+                failures.append({"benchmark": name, "metric": metric,
+                                 "value": results[name][metric], "limit": limit})
+    return failures
+
+
+def main():
+    args = parse_args(sys.argv)
+    results = {}
+    for benchmark in BENCHMARKS:
+        results[benchmark.__name__] = measure(benchmark, args["iterations"])
+
+    with open(args["budget"]) as f:
+        budget = json.load(f)
+
+    report = {"implementation": IMPLEMENTATION,
+              "version": ".".join(str(v) for v in sys.implementation.version[:3]),
+              "iterations": args["iterations"],
+              "results": results,
+              "failures": check(results, budget)}
+
+    text = json.dumps(report)
+    print(text)
+    if args["output"] is not None:
+        with open(args["output"], "w") as f:
+            f.write(text)
+
+    if report["failures"]:
+        sys.exit(1)
+
+
+main()
@@ -1,21 +1,19 @@
 import time
 
-from machine import I2C
+from machine import I2C, Timer
 
-from qwstpad import ADDRESSES, NUM_LEDS, QwSTPad
+from qwstpad import ADDRESSES, QwSTPad
+from qwstpad_anim import LedAnimator
 
 """
 Apply a wave effect across QwSTPad's onboard LEDs.
+The wave is animated from a timer, leaving the main loop free for other work.
 """
 
 # Constants
 I2C_PINS = {"id": 0, "sda": 4, "scl": 5}    # The I2C pins the QwSTPad is connected to
 I2C_ADDRESS = ADDRESSES[0]                  # The I2C address of the connected QwSTPad
-SLEEP = 0.2                                 # The time between each LED update
-
-# Variables
-led = 1                                     # The LED currently being controlled
-active = True                               # The state to set the controlled LED to
+STEP_MS = 200                               # The time between each LED update (in ms)
 
 
 # Attempt to create the I2C instance and pass that to the QwSTPad
@@ -27,30 +25,29 @@ except OSError:
 
 print("QwSTPad: Connected ... Starting")
 
+animator = LedAnimator(qwstpad)
+
 # Wrap the code in a try block, to catch any exceptions (including KeyboardInterrupt)
 try:
     qwstpad.clear_leds()    # Turn off all four LEDs
 
-    # Loop forever
-    while True:
-        # Modify the current LED
-        qwstpad.set_led(led, active)
-        print(f"{led}: {active}")
+    # Start the wave, with a timer updating the LEDs in the background
+    animator.wave(STEP_MS)
+    animator.attach(Timer())
 
-        # Move along to the next LED, wrapping if reaching the end
-        led += 1
-        if led > NUM_LEDS:
-            led = 1
-            active = not active
+    # Loop until the animation stops because the QwSTPad was disconnected
+    while animator.error() is None:
+        time.sleep(0.1)
 
-        time.sleep(SLEEP)
+    raise animator.error()
 
 # Handle the QwSTPad being disconnected unexpectedly
 except OSError:
     print("QwSTPad: Disconnected .. Exiting")
     qwstpad = None
 
-# Turn off all four LEDs if there is still a QwSTPad
+# Stop the animation, and turn off all four LEDs if there is still a QwSTPad
 finally:
+    animator.detach()
     if qwstpad is not None:
         qwstpad.clear_leds()
@@ -2,7 +2,7 @@ import time
 
 from machine import I2C
 
-from qwstpad import ADDRESSES, QwSTPad
+from qwstpad import ADDRESSES, QwSTPadBus
 
 """
 How to detect multiple QwSTPads and handle their unexpected connection and disconnection.
@@ -13,43 +13,47 @@ I2C_PINS = {"id": 0, "sda": 4, "scl": 5}    # The I2C pins the QwSTPads are conn
 SLEEP = 0.2                                 # The time between each check of connected pads
 
 # Variables
-i2c = I2C(**I2C_PINS)                       # The I2C instance to pass to all QwSTPads
-pads = {}                                   # The dictionary to store QwSTPad objects
 active = False                              # The state to set the controlled LEDs to
 
+
+# Functions called by the bus when a pad is connected or disconnected
+def connected(index, pad):
+    print(f"{hex(ADDRESSES[index])}: Connected")
+
+
+def disconnected(index):
+    print(f"{hex(ADDRESSES[index])}: Disconnected")
+
+
+# The bus that looks after all the QwSTPads. Missing pads are checked for less often the longer they are missing
+bus = QwSTPadBus(I2C(**I2C_PINS), on_connect=connected, on_disconnect=disconnected)
+
 # Wrap the code in a try block, to catch any exceptions (including KeyboardInterrupt)
 try:
     while True:
-        print("QwSTPads: ", end="")
+        # Look for any pads that are not yet connected
+        bus.supervise()
 
         # Go through each valid QwSTPad address
-        for addr in ADDRESSES:
-
-            # Is the pad already registered?
-            if addr in pads:
-                try:
-                    # Do some action to confirm it is still connected
-                    if active:
-                        pads[addr].set_leds(pads[addr].address_code())
-                    else:
-                        pads[addr].clear_leds()
-                except OSError:
-                    # If that fails, unregister it
-                    del pads[addr]
-
-            # The pad is not registered
-            else:
-                try:
-                    # Attempt to connect to and register it
-                    pads[addr] = QwSTPad(i2c, addr)
-                except OSError:
-                    # If that fails, carry on
-                    pass
+        print("QwSTPads: ", end="")
+        for i in range(len(ADDRESSES)):
+            pad = bus.pad(i)
+
+            # Is the pad connected?
+            if pad is not None:
+                # Do some action, which will confirm it is still connected when flushed
+                if active:
+                    pad.set_leds(pad.address_code())
+                else:
+                    pad.clear_leds()
 
             # Print out the connected state of the current pad
-            print(f"{hex(addr)}" if addr in pads else "----", end=" ")
+            print(f"{hex(ADDRESSES[i])}" if pad is not None else "----", end=" ")
         print()
 
+        # Write the LED changes, disconnecting any pads that fail
+        bus.flush()
+
         # Toggle the LED state for next time
         active = not active
 
@@ -57,8 +61,10 @@ try:
 
 # Turn off the LEDs of any connected QwSTPads
 finally:
-    for addr in pads:
-        try:
-            pads[addr].clear_leds()
-        except OSError:
-            pass
+    for i in range(len(ADDRESSES)):
+        pad = bus.pad(i)
+        if pad is not None:
+            try:
+                pad.clear_leds(force=True)
+            except OSError:
+                pass
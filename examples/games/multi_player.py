@@ -5,7 +5,7 @@ from machine import I2C
 from picographics import DISPLAY_PICO_DISPLAY_2 as DISPLAY
 from picographics import PEN_RGB565, PicoGraphics, RGB_to_RGB565
 
-from qwstpad import ADDRESSES, QwSTPad
+from qwstpad import ADDRESSES, BTN_A, QwSTPadBus
 
 """
 A multi-player QwSTPad game demo. Each player drives a tank-like vehicle around an arena
@@ -54,7 +54,7 @@ TEXT_SHADOW = 2
 # Variables
 display = PicoGraphics(display=DISPLAY,         # The PicoGraphics instance used for drawing to the display
                        pen_type=PEN_RGB565)     # It uses 16 bit (RGB565) colours
-i2c = I2C(**I2C_PINS)                           # The I2C instance to pass to all QwSTPads
+bus = QwSTPadBus(I2C(**I2C_PINS))               # The bus that connects to, polls and updates all QwSTPads
 players = []                                    # The list that will store the player objects
 complete = False                                # Has the game been completed?
 
@@ -105,29 +105,20 @@ class Player:
         if len(self.projectiles) < PROJECTILE_LIMIT:
             self.projectiles.append(Projectile(self.x, self.y, self.direction))
 
-    def update(self):
-        # Read the player's gamepad
-        button = self.pad.read_buttons()
-
-        if button['L']:
-            self.direction -= 0.1
-
-        if button['R']:
-            self.direction += 0.1
+    def update(self, buttons):
+        # Left and right turn the player, and up and down move it forward and backward
+        turn, move = self.pad.vector(buttons)
+        self.direction += 0.1 * turn
 
-        if button['U']:
-            self.x += PLAYER_SPEED * math.cos(self.direction)
-            self.y += PLAYER_SPEED * math.sin(self.direction)
-
-        if button['D']:
-            self.x -= PLAYER_SPEED * math.cos(self.direction)
-            self.y -= PLAYER_SPEED * math.sin(self.direction)
+        if move:
+            self.x -= PLAYER_SPEED * move * math.cos(self.direction)
+            self.y -= PLAYER_SPEED * move * math.sin(self.direction)
 
         # Clamp the player to the screen area
         self.x = min(max(self.x, self.size), WIDTH - self.size)
         self.y = min(max(self.y, self.size), HEIGHT - self.size)
 
-        if button['A']:
+        if buttons & BTN_A:
             self.fire()
 
         new_proj = []
@@ -177,12 +168,12 @@ class Player:
 
 # Create a player for each connected QwSTPad
 for i in range(len(ADDRESSES)):
-    try:
+    pad = bus.pad(i)
+    if pad is not None:
         p = PLAYERS[i]
-        pad = QwSTPad(i2c, ADDRESSES[i])
         players.append(Player(i, p.x, p.y, PLAYER_RADIUS, p.colour, pad))
         print(f"P{i + 1}: Connected")
-    except OSError:
+    else:
         print(f"P{i + 1}: Not Connected")
 
 if len(players) == 0:
@@ -199,15 +190,18 @@ try:
     # Loop forever
     while True:
         if not complete:
+            # Read all the gamepads at once
+            buttons = bus.poll()
+
             # Update all players (and their projectiles)
             for p in players:
-                try:
-                    p.update()
                 # Handle QwSTPads being disconnected unexpectedly
-                except OSError:
+                if bus.pad(p.index) is None:
                     print(f"P{p.index + 1}: Disconnected ... Exiting")
                     raise SystemExit
 
+                p.update(buttons[p.index])
+
             # Check if any projectiles have hit players
             for p in players:
                 p.check_hits(players)
@@ -247,13 +241,14 @@ try:
             display.set_pen(WHITE)
             display.text("Game Complete!", WIDTH // 6, 105, WIDTH, 3)
 
-        # Update the screen
+        # Update the screen, and any LEDs that were changed while drawing
         display.update()
+        bus.flush()
 
 # Turn off the LEDs of any connected QwSTPads
 finally:
     for p in players:
         try:
-            p.pad.clear_leds()
+            p.pad.clear_leds(force=True)
         except OSError:
             pass
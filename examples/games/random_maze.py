@@ -1,13 +1,12 @@
 import gc
 import random
-import time
 from collections import namedtuple
 
 from machine import I2C
 from picographics import DISPLAY_PICO_DISPLAY_2 as DISPLAY
 from picographics import PEN_RGB565, PicoGraphics, RGB_to_RGB565
 
-from qwstpad import ADDRESSES, QwSTPad
+from qwstpad import ADDRESSES, BTN_PLUS, QwSTPad
 
 """
 A single player QwSTPad game demo. Navigate a set of mazes from the start (red) to the goal (green).
@@ -46,8 +45,9 @@ MAX_MAZE_HEIGHT = 5
 WALL_SHADOW = 2
 WALL_GAP = 1
 TEXT_SHADOW = 2
-MOVEMENT_SLEEP = 0.1
 DIFFICULT_SCALE = 0.5
+REPEAT_DELAY = 300                  # The time a direction must be held before the player keeps moving (in ms)
+REPEAT_INTERVAL = 100               # The time between each move while a direction is held (in ms)
 
 # Variables
 display = PicoGraphics(display=DISPLAY,         # The PicoGraphics instance used for drawing to the display
@@ -221,24 +221,13 @@ class Player(object):
         self.y = y
 
     def update(self, maze):
-        # Read the player's gamepad
-        button = self.pad.read_buttons()
+        # Read the player's gamepad, and only move on buttons that have just been pressed or are repeating
+        self.pad.read_buttons_mask()
+        dx, dy = self.pad.vector(self.pad.repeated())
 
-        if button['L'] and maze[self.y][self.x - 1] != 1:
-            self.x -= 1
-            time.sleep(MOVEMENT_SLEEP)
-
-        elif button['R'] and maze[self.y][self.x + 1] != 1:
-            self.x += 1
-            time.sleep(MOVEMENT_SLEEP)
-
-        elif button['U'] and maze[self.y - 1][self.x] != 1:
-            self.y -= 1
-            time.sleep(MOVEMENT_SLEEP)
-
-        elif button['D'] and maze[self.y + 1][self.x] != 1:
-            self.y += 1
-            time.sleep(MOVEMENT_SLEEP)
+        if maze[self.y + dy][self.x + dx] != 1:
+            self.x += dx
+            self.y += dy
 
         maze[self.y][self.x] = 2
 
@@ -280,6 +269,8 @@ build_maze()
 # Create the player object if a QwSTPad is connected
 try:
     player = Player(*start, PLAYER, QwSTPad(i2c, I2C_ADDRESS))
+    player.pad.set_repeat(REPEAT_DELAY, REPEAT_INTERVAL)
+    player.pad.set_directions(diagonals=False)
 except OSError:
     print("QwSTPad: Not Connected ... Exiting")
     raise SystemExit
@@ -302,7 +293,8 @@ try:
                 complete = True
         else:
             # Check for the player wanting to continue
-            if player.pad.read_buttons()['+']:
+            player.pad.read_buttons_mask()
+            if player.pad.just_pressed() & BTN_PLUS:
                 complete = False
                 level += 1
                 build_maze()
@@ -1,5 +1,7 @@
-import struct
-from collections import OrderedDict
+import sys
+import time
+from array import array
+from collections import OrderedDict, namedtuple
 
 from micropython import const
 
@@ -15,6 +17,125 @@ ALT_ADDRESS_2 = const(0x25)
 ALT_ADDRESS_3 = const(0x27)
 ADDRESSES = (DEFAULT_ADDRESS, ALT_ADDRESS_1, ALT_ADDRESS_2, ALT_ADDRESS_3)
 
+# Button bits returned by read_buttons_mask(), in BUTTON_MAPPING order
+BTN_A = const(1 << 0)
+BTN_B = const(1 << 1)
+BTN_X = const(1 << 2)
+BTN_Y = const(1 << 3)
+BTN_U = const(1 << 4)
+BTN_D = const(1 << 5)
+BTN_L = const(1 << 6)
+BTN_R = const(1 << 7)
+BTN_PLUS = const(1 << 8)
+BTN_MINUS = const(1 << 9)
+BTN_ALL = const((1 << NUM_BUTTONS) - 1)
+
+# Directions returned by QwSTPad.direction(), clockwise from up
+DIR_NONE = const(0)
+DIR_UP = const(1)
+DIR_UP_RIGHT = const(2)
+DIR_RIGHT = const(3)
+DIR_DOWN_RIGHT = const(4)
+DIR_DOWN = const(5)
+DIR_DOWN_LEFT = const(6)
+DIR_LEFT = const(7)
+DIR_UP_LEFT = const(8)
+
+# The (dx, dy) of each direction, with y increasing downwards as on a display
+DIRECTION_VECTORS = ((0, 0), (0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0), (-1, -1))
+
+# Snapshot returned by QwSTPad.stats()
+Stats = namedtuple("Stats", ("reads", "writes", "elided_writes", "errors", "min_us", "max_us", "avg_us"))
+
+# Register values returned by QwSTPad.read_config() and QwSTPad.expected_config()
+Config = namedtuple("Config", ("configuration", "polarity", "output"))
+
+
+def _build_remap(pins, bits=None):
+    # Build two 256 entry tables that translate the low and high bytes of
+    # the input port into logical button bits, with pins[i] becoming bit i
+    # or, if given, the bits in bits[i]
+    low_bits = [0] * 8
+    high_bits = [0] * 8
+    for i in range(len(pins)):
+        bit = 1 << i if bits is None else bits[i]
+        if pins[i] < 8:
+            low_bits[pins[i]] |= bit
+        else:
+            high_bits[pins[i] - 8] |= bit
+
+    # Each entry is an earlier entry plus its top bit, so the tables take one pass to fill
+    low = array("H", [0] * 256)
+    high = array("H", [0] * 256)
+    for bit in range(8):
+        top = 1 << bit
+        for value in range(top, top << 1):
+            low[value] = low[value - top] | low_bits[bit]
+            high[value] = high[value - top] | high_bits[bit]
+    return low, high
+
+
+def _py_decode(low, high, state):
+    return low[state & 0xFF] | high[state >> 8]
+
+
+def _py_encode(buffer, value):
+    buffer[0] = value & 0xFF
+    buffer[1] = value >> 8
+
+
+# Use the viper versions where the port can compile them. A precompiled
+# qwstpad_native.mpy built for another architecture raises ValueError
+_decode, _encode = _py_decode, _py_encode
+if sys.implementation.name == "micropython":
+    try:
+        import qwstpad_native
+        _decode, _encode = qwstpad_native.decode, qwstpad_native.encode
+    except (ImportError, SyntaxError, ValueError):
+        pass
+
+
+def _build_directions(diagonals, cancel):
+    # Build the direction for every combination of the four D-pad bits,
+    # indexed by (mask >> 4) & 0xF so U is bit 0, D bit 1, L bit 2 and R bit 3
+    directions = bytearray(16)
+    for dpad in range(16):
+        up, down, left, right = dpad & 1, (dpad >> 1) & 1, (dpad >> 2) & 1, (dpad >> 3) & 1
+        if cancel:
+            dx, dy = right - left, down - up
+        else:
+            # Without cancelling, up beats down and left beats right
+            dx, dy = -left or right, -up or down
+        if not diagonals and dx and dy:
+            dx = 0
+        directions[dpad] = DIRECTION_VECTORS.index((dx, dy))
+    return bytes(directions)
+
+
+def _build_config(buttons, leds):
+    # Only the LED pins are outputs, and only the button pins are inverted,
+    # so a pressed button reads as 1 without any work in software
+    configuration = 0xFFFF
+    for pin in leds:
+        configuration &= ~(1 << pin)
+    polarity = 0
+    for pin in buttons:
+        polarity |= 1 << pin
+    return configuration, polarity
+
+
+def _build_led_outputs(pins):
+    # Build the output port word for every combination of LED states,
+    # with the pin for each lit LED driven low
+    outputs = []
+    for states in range(1 << len(pins)):
+        output = 0
+        for i in range(len(pins)):
+            if not states & (1 << i):
+                output |= 1 << pins[i]
+        outputs.append(output)
+    return tuple(outputs)
+
 
 class QwSTPad:
     # Registers
@@ -34,66 +155,598 @@ class QwSTPad:
                                   })
     LED_MAPPING = (0x6, 0x7, 0x9, 0xA)
 
-    def __init__(self, i2c, address=DEFAULT_ADDRESS, show_address=True):
+    # Lookup tables built from the mappings, so polling can use them without allocating
+    __REMAP_LOW, __REMAP_HIGH = _build_remap(tuple(BUTTON_MAPPING.values()))
+    __LED_OUTPUTS = _build_led_outputs(LED_MAPPING)
+    __CONFIGURATION, __POLARITY = _build_config(BUTTON_MAPPING.values(), LED_MAPPING)
+    __DIRECTIONS = _build_directions(True, True)
+
+    def __init__(self, i2c, address=DEFAULT_ADDRESS, show_address=True, interrupt=None, stats=False, lazy=False, verify=False):
         if address not in ADDRESSES:
             raise ValueError("address is not valid. Expected: 0x21, 0x23, 0x25, or 0x27")
 
         self.__i2c = i2c
         self.__address = address
+        self.__read_buffer = bytearray(2)
+        self.__write_buffer = bytearray(2)
 
-        # Set up the TCA9555 with the correct input and output pins
-        self.__reg_write_uint16(self.__i2c, self.__address, self.CONFIGURATION_PORT0, 0b11111001_00111111)
-        self.__reg_write_uint16(self.__i2c, self.__address, self.POLARITY_PORT0, 0b11111000_00111111)
-        self.__reg_write_uint16(self.__i2c, self.__address, self.OUTPUT_PORT0, 0b00000110_11000000)
+        # Choose the register functions once, so the uninstrumented path has no extra checks
+        self.reset_stats()
+        if stats:
+            self.__read = self.__timed_read_uint16
+            self.__write = self.__timed_write_uint16
+        else:
+            self.__read = self.__reg_read_uint16
+            self.__write = self.__reg_write_uint16
 
-        self.__button_states = OrderedDict({})
-        for key, _ in self.BUTTON_MAPPING.items():
-            self.__button_states[key] = False
+        self.__verify = verify
+        self.__configured = False
+        self.__output = None
 
-        self.__led_states = 0b0000
-        if show_address:
-            self.set_leds(self.address_code())
+        self.__button_states = ButtonState()
+
+        self.__raw_buttons = 0
+        self.__buttons = 0
+        self.__last_buttons = 0
+        self.__directions = self.__DIRECTIONS
+        self.__remap_low = self.__REMAP_LOW
+        self.__remap_high = self.__REMAP_HIGH
+
+        self.__interrupt = interrupt
+        self.__dirty = True
+
+        # Debounce and auto-repeat state, kept as one entry per button bit
+        self.__debounce_windows = array("H", [0] * NUM_BUTTONS)
+        self.__debouncing = False
+        self.__bouncing = 0
+        self.__bounce_since = array("L", [0] * NUM_BUTTONS)
+        self.__repeat_delay = 0
+        self.__repeat_interval = 0
+        self.__repeats = 0
+        self.__repeat_due = array("L", [0] * NUM_BUTTONS)
+
+        # Event queue, allocated by enable_events()
+        self.__event_codes = None
+        self.__event_ticks = None
+        self.__event_head = 0
+        self.__event_tail = 0
+        self.__event_overflows = 0
+
+        self.__led_states = self.address_code() if show_address else 0b0000
+        self.__auto_flush = True
+
+        # Set up the TCA9555 now, or leave it until the pad is first used
+        if not lazy:
+            self.__configure()
+
+        # With an interrupt pin, the input port is only read after the TCA9555 signals a change
+        if interrupt is not None:
+            interrupt.irq(handler=self.__handle_interrupt, trigger=interrupt.IRQ_FALLING)
 
     def address_code(self):
-        return self.__change_bit(0x0000, ADDRESSES.index(self.__address), True)
+        return 1 << ADDRESSES.index(self.__address)
 
     def read_buttons(self):
-        state = self.__reg_read_uint16(self.__i2c, self.__address, self.INPUT_PORT0)
-        for key, value in self.BUTTON_MAPPING.items():
-            self.__button_states[key] = self.__get_bit(state, value)
+        # The same state is updated on each read, so take a .snapshot() of it to keep
+        self.__button_states._mask = self.read_buttons_mask()
         return self.__button_states
 
-    def set_leds(self, states):
+    def read_buttons_mask(self):
+        if not self.__configured:
+            self.__configure()
+
+        if self.__dirty or self.__interrupt is None:
+            # Clear the flag first, so a change during the read is not lost
+            self.__dirty = False
+            try:
+                state = self.__read(self.__i2c, self.__address, self.INPUT_PORT0)
+            except OSError:
+                self.__dirty = True
+                raise
+            self.__raw_buttons = _decode(self.__remap_low, self.__remap_high, state)
+
+        buttons = self.__raw_buttons
+        if self.__debouncing:
+            buttons = self.__debounce(buttons)
+        self.__last_buttons = self.__buttons
+        self.__buttons = buttons
+        if self.__repeat_interval:
+            self.__update_repeats()
+        if self.__event_codes is not None and buttons != self.__last_buttons:
+            self.__record_events(buttons ^ self.__last_buttons)
+        return buttons
+
+    def just_pressed(self):
+        return self.__buttons & ~self.__last_buttons
+
+    def just_released(self):
+        return self.__last_buttons & ~self.__buttons
+
+    def held(self):
+        return self.__buttons & self.__last_buttons
+
+    def repeated(self):
+        if self.__repeat_interval:
+            return self.__repeats
+        return self.just_pressed()
+
+    def direction(self, buttons=None):
+        if buttons is None:
+            buttons = self.__buttons
+        return self.__directions[(buttons >> 4) & 0xF]
+
+    def vector(self, buttons=None):
+        return DIRECTION_VECTORS[self.direction(buttons)]
+
+    def set_directions(self, diagonals=True, cancel=True):
+        if diagonals and cancel:
+            self.__directions = self.__DIRECTIONS
+        else:
+            self.__directions = _build_directions(diagonals, cancel)
+
+    def set_profile(self, profile=None):
+        # Only the tables change, and the next read uses them even if the interrupt has not fired
+        if profile is None:
+            self.__remap_low, self.__remap_high = self.__REMAP_LOW, self.__REMAP_HIGH
+        else:
+            self.__remap_low, self.__remap_high = profile.low, profile.high
+        self.__dirty = True
+
+    def set_debounce(self, ms, buttons=BTN_ALL):
+        if ms < 0 or ms > 0xFFFF:
+            raise ValueError("'ms' out of range. Expected 0 to 65535")
+
+        windows = self.__debounce_windows
+        for i in range(NUM_BUTTONS):
+            if buttons & (1 << i):
+                windows[i] = ms
+        self.__debouncing = any(windows)
+        self.__bouncing = 0
+
+    def set_repeat(self, delay_ms=0, interval_ms=0):
+        if delay_ms < 0 or interval_ms < 0:
+            raise ValueError("'delay_ms' and 'interval_ms' must not be negative")
+
+        self.__repeat_delay = delay_ms
+        self.__repeat_interval = interval_ms
+        self.__repeats = 0
+
+    def enable_events(self, capacity=32):
+        if capacity < 0 or capacity > 255:
+            raise ValueError("'capacity' out of range. Expected 0 to 255")
+
+        if capacity == 0:
+            self.__event_codes = None
+            self.__event_ticks = None
+        else:
+            # One slot is always left empty, so a full queue can be told apart from an empty one
+            self.__event_codes = bytearray(capacity + 1)
+            self.__event_ticks = array("L", [0] * (capacity + 1))
+        self.__event_head = 0
+        self.__event_tail = 0
+        self.__event_overflows = 0
+
+    def events_pending(self):
+        if self.__event_codes is None:
+            return 0
+        return (self.__event_head - self.__event_tail) % len(self.__event_codes)
+
+    def event_overflows(self):
+        return self.__event_overflows
+
+    def read_event(self):
+        codes = self.__event_codes
+        if codes is None or self.__event_tail == self.__event_head:
+            return None
+
+        tail = self.__event_tail
+        code = codes[tail]
+        ticks = self.__event_ticks[tail]
+        self.__event_tail = (tail + 1) % len(codes)
+        return 1 << (code & 0x7F), (code & 0x80) != 0, ticks
+
+    def clear_events(self):
+        self.__event_tail = self.__event_head
+
+    def set_leds(self, states, force=False):
         self.__led_states = states & 0b1111
-        self.__update_leds()
+        self.__update_leds(force)
 
-    def set_led(self, led, state):
+    def set_led(self, led, state, force=False):
         if led < 1 or led > NUM_LEDS:
             raise ValueError("'led' out of range. Expected 1 to 4")
 
-        self.__led_states = self.__change_bit(self.__led_states, led - 1, state)
-        self.__update_leds()
+        if state:
+            self.__led_states |= 1 << (led - 1)
+        else:
+            self.__led_states &= ~(1 << (led - 1))
+        self.__update_leds(force)
 
-    def clear_leds(self):
+    def clear_leds(self, force=False):
         self.__led_states = 0b0000
-        self.__update_leds()
+        self.__update_leds(force)
 
-    def __update_leds(self):
-        output = 0
-        for i in range(NUM_LEDS):
-            output = self.__change_bit(output, self.LED_MAPPING[i], not self.__get_bit(self.__led_states, i))
-        self.__reg_write_uint16(self.__i2c, self.__address, self.OUTPUT_PORT0, output)
+    def led_states(self):
+        return self.__led_states
+
+    def elided_writes(self):
+        return self.__elided_writes
+
+    def stats(self):
+        transactions = self.__reads + self.__writes
+        return Stats(self.__reads, self.__writes, self.__elided_writes, self.__errors,
+                     self.__min_us if transactions else 0, self.__max_us,
+                     self.__total_us // transactions if transactions else 0)
+
+    def reset_stats(self):
+        self.__reads = 0
+        self.__writes = 0
+        self.__elided_writes = 0
+        self.__errors = 0
+        self.__min_us = 0
+        self.__max_us = 0
+        self.__total_us = 0
+
+    def expected_config(self):
+        output = self.__output if self.__configured else self.__LED_OUTPUTS[self.__led_states]
+        return Config(self.__CONFIGURATION, self.__POLARITY, output)
+
+    def read_config(self):
+        return Config(self.__read(self.__i2c, self.__address, self.CONFIGURATION_PORT0),
+                      self.__read(self.__i2c, self.__address, self.POLARITY_PORT0),
+                      self.__read(self.__i2c, self.__address, self.OUTPUT_PORT0))
+
+    def verify_config(self):
+        # A mismatch usually means the pad lost power, which reinit() will correct
+        return self.read_config() == self.expected_config()
 
-    def __get_bit(self, num, bit_pos):
-        return (num & (1 << bit_pos)) != 0
+    def set_auto_flush(self, enabled):
+        self.__auto_flush = enabled
 
-    def __change_bit(self, num, bit_pos, state):
-        return num | (1 << bit_pos) if state else num & ~(1 << bit_pos)
+    def reinit(self):
+        # Set up the TCA9555 again, such as after it has been reconnected
+        self.__configured = False
+        self.__configure()
+
+    def flush_leds(self, force=False):
+        if not self.__configured:
+            # Setting up the pad also writes the current LED states
+            self.__configure()
+            return
+
+        output = self.__LED_OUTPUTS[self.__led_states]
+
+        # Skip the write if the output port already holds this value
+        if output == self.__output and not force:
+            self.__elided_writes += 1
+            return
+
+        self.__write(self.__i2c, self.__address, self.OUTPUT_PORT0, output)
+        self.__output = output
+
+    def __update_leds(self, force=False):
+        # Without auto flush, changes wait for the next flush_leds() unless forced
+        if self.__auto_flush or force:
+            self.flush_leds(force)
+
+    def __record_events(self, changed):
+        # Only the reader moves the tail, and only this moves the head, so
+        # the queue can be drained from elsewhere without a lock
+        codes = self.__event_codes
+        ticks = self.__event_ticks
+        size = len(codes)
+        head = self.__event_head
+        now = time.ticks_ms()
+        for i in range(NUM_BUTTONS):
+            bit = 1 << i
+            if changed & bit:
+                next_head = (head + 1) % size
+                if next_head == self.__event_tail:
+                    self.__event_overflows += 1
+                    continue
+                codes[head] = i | (0x80 if self.__buttons & bit else 0)
+                ticks[head] = now
+                head = next_head
+                self.__event_head = head
+
+    def __configure(self):
+        # Set up the TCA9555 with the correct input and output pins, with the LEDs already in their requested states
+        output = self.__LED_OUTPUTS[self.__led_states]
+        self.__configure_register(self.CONFIGURATION_PORT0, self.__CONFIGURATION)
+        self.__configure_register(self.POLARITY_PORT0, self.__POLARITY)
+        self.__configure_register(self.OUTPUT_PORT0, output)
+        self.__output = output
+        self.__configured = True
+        self.__dirty = True
+
+    def __configure_register(self, reg, value):
+        # When verifying, a register that already holds the value is not written again
+        if self.__verify and self.__read(self.__i2c, self.__address, reg) == value:
+            return
+        self.__write(self.__i2c, self.__address, reg, value)
+
+    def __handle_interrupt(self, pin):
+        self.__dirty = True
+
+    def __debounce(self, buttons):
+        # Only accept a change once a button has read differently to its
+        # stable state for its whole window, restarting if it bounces back
+        stable = self.__buttons
+        changed = buttons ^ stable
+        bouncing = self.__bouncing & changed
+        if changed:
+            now = time.ticks_ms()
+            windows = self.__debounce_windows
+            since = self.__bounce_since
+            for i in range(NUM_BUTTONS):
+                bit = 1 << i
+                if changed & bit:
+                    if not bouncing & bit:
+                        since[i] = now
+                        bouncing |= bit
+                    if time.ticks_diff(now, since[i]) >= windows[i]:
+                        stable ^= bit
+                        bouncing &= ~bit
+        self.__bouncing = bouncing
+        return stable
+
+    def __update_repeats(self):
+        pressed = self.__buttons & ~self.__last_buttons
+        held = self.__buttons & self.__last_buttons
+        repeats = pressed
+        if pressed | held:
+            now = time.ticks_ms()
+            due = self.__repeat_due
+            for i in range(NUM_BUTTONS):
+                bit = 1 << i
+                if pressed & bit:
+                    due[i] = time.ticks_add(now, self.__repeat_delay)
+                elif held & bit and time.ticks_diff(now, due[i]) >= 0:
+                    due[i] = time.ticks_add(now, self.__repeat_interval)
+                    repeats |= bit
+        self.__repeats = repeats
+
+    def __timed_read_uint16(self, i2c, address, reg):
+        start = time.ticks_us()
+        try:
+            value = self.__reg_read_uint16(i2c, address, reg)
+        except OSError:
+            self.__errors += 1
+            raise
+        self.__reads += 1
+        self.__record_latency(time.ticks_diff(time.ticks_us(), start))
+        return value
+
+    def __timed_write_uint16(self, i2c, address, reg, value):
+        start = time.ticks_us()
+        try:
+            self.__reg_write_uint16(i2c, address, reg, value)
+        except OSError:
+            self.__errors += 1
+            raise
+        self.__writes += 1
+        self.__record_latency(time.ticks_diff(time.ticks_us(), start))
+
+    def __record_latency(self, us):
+        if us < self.__min_us or self.__reads + self.__writes == 1:
+            self.__min_us = us
+        self.__max_us = max(self.__max_us, us)
+        self.__total_us += us
 
     def __reg_write_uint16(self, i2c, address, reg, value):
-        buffer = struct.pack("<H", value)
+        buffer = self.__write_buffer
+        _encode(buffer, value)
         i2c.writeto_mem(address, reg, buffer)
 
     def __reg_read_uint16(self, i2c, address, reg):
-        buffer = i2c.readfrom_mem(address, reg, 2)
-        return struct.unpack("<H", buffer)[0]
+        buffer = self.__read_buffer
+        i2c.readfrom_mem_into(address, reg, buffer)
+        return buffer[0] | (buffer[1] << 8)
+
+
+class ButtonState:
+    # The mask is read-only, so only the pad that owns a state can change it,
+    # and a snapshot never changes
+    __slots__ = ("_mask",)
+
+    def __init__(self, mask=0):
+        self._mask = mask
+
+    @property
+    def mask(self):
+        return self._mask
+
+    def __getitem__(self, key):
+        return (self._mask >> _BUTTON_BITS[key]) & 1 == 1
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __contains__(self, key):
+        return key in _BUTTON_BITS
+
+    def __iter__(self):
+        return iter(QwSTPad.BUTTON_MAPPING)
+
+    def __len__(self):
+        return NUM_BUTTONS
+
+    def __eq__(self, other):
+        if isinstance(other, ButtonState):
+            return self._mask == other._mask
+        return dict(self.items()) == other
+
+    def __repr__(self):
+        return "ButtonState(" + ", ".join(key + "=" + str(int(value)) for key, value in self.items()) + ")"
+
+    def get(self, key, default=None):
+        return self[key] if key in _BUTTON_BITS else default
+
+    def keys(self):
+        return QwSTPad.BUTTON_MAPPING.keys()
+
+    def values(self):
+        return (self[key] for key in QwSTPad.BUTTON_MAPPING)
+
+    def items(self):
+        return ((key, self[key]) for key in QwSTPad.BUTTON_MAPPING)
+
+    def snapshot(self):
+        return ButtonState(self._mask)
+
+
+_BUTTON_BITS = {key: i for i, key in enumerate(QwSTPad.BUTTON_MAPPING)}
+
+
+class Profile:
+    def __init__(self, mapping, passthrough=True):
+        # Buttons used by the profile give up their own bit, while the rest keep theirs if passing through
+        sources = 0
+        for action, buttons in mapping.items():
+            if action <= 0 or action & ~BTN_ALL:
+                raise ValueError("profile actions must be masks of the first 10 bits")
+            if buttons <= 0 or buttons & ~BTN_ALL:
+                raise ValueError("profile buttons must be masks of BTN_ constants")
+            sources |= buttons
+
+        bits = [0] * NUM_BUTTONS
+        for i in range(NUM_BUTTONS):
+            if passthrough and not sources & (1 << i):
+                bits[i] = 1 << i
+
+        for action, buttons in mapping.items():
+            for i in range(NUM_BUTTONS):
+                if buttons & (1 << i):
+                    bits[i] |= action
+
+        self.low, self.high = _build_remap(tuple(QwSTPad.BUTTON_MAPPING.values()), bits)
+
+
+def mask_to_dict(mask):
+    states = OrderedDict()
+    bit = 1
+    for key in QwSTPad.BUTTON_MAPPING:
+        states[key] = (mask & bit) != 0
+        bit <<= 1
+    return states
+
+
+class QwSTPadBus:
+    # Backoff between probes of a missing pad, doubling after each failed probe
+    MIN_BACKOFF_MS = const(100)
+    MAX_BACKOFF_MS = const(3200)
+
+    def __init__(self, i2c, addresses=ADDRESSES, show_address=True, on_connect=None, on_disconnect=None):
+        self.__i2c = i2c
+        self.__show_address = show_address
+        self.__on_connect = on_connect
+        self.__on_disconnect = on_disconnect
+        self.__pads = [None] * len(ADDRESSES)
+        self.__known = [None] * len(ADDRESSES)
+        self.__buttons = array("H", [0] * len(ADDRESSES))
+        self.__connected = 0
+        self.__supervised = 0
+        self.__probe_buffer = bytearray(1)
+        self.__probe_due = array("L", [0] * len(ADDRESSES))
+        self.__backoff = array("H", [self.MIN_BACKOFF_MS] * len(ADDRESSES))
+
+        for address in addresses:
+            if address not in ADDRESSES:
+                raise ValueError("address is not valid. Expected: 0x21, 0x23, 0x25, or 0x27")
+            self.__supervised |= 1 << ADDRESSES.index(address)
+            self.connect(address, show_address)
+
+    def connect(self, address, show_address=True):
+        if address not in ADDRESSES:
+            raise ValueError("address is not valid. Expected: 0x21, 0x23, 0x25, or 0x27")
+
+        # A pad that is already connected is left as it is
+        index = ADDRESSES.index(address)
+        if self.__connected & (1 << index):
+            return self.__pads[index]
+
+        # A pad seen before is set up again, so it keeps its settings and LED states
+        pad = self.__known[index]
+        try:
+            if pad is None:
+                pad = QwSTPad(self.__i2c, address, show_address)
+                pad.set_auto_flush(False)
+                self.__known[index] = pad
+            else:
+                pad.reinit()
+        except OSError:
+            self.__disconnect(index)
+            self.__schedule_probe(index, self.__backoff[index])
+            return None
+
+        self.__pads[index] = pad
+        self.__connected |= 1 << index
+        self.__backoff[index] = self.MIN_BACKOFF_MS
+        if self.__on_connect is not None:
+            self.__on_connect(index, pad)
+        return pad
+
+    def pad(self, index):
+        return self.__pads[index]
+
+    def connected(self):
+        return self.__connected
+
+    def poll(self):
+        # Read every connected pad into the shared array, indexed the same as ADDRESSES
+        buttons = self.__buttons
+        pads = self.__pads
+        for i in range(len(ADDRESSES)):
+            pad = pads[i]
+            if pad is not None:
+                try:
+                    buttons[i] = pad.read_buttons_mask()
+                except OSError:
+                    self.__disconnect(i)
+        return buttons
+
+    def flush(self):
+        # Write any LED changes made since the last flush, one write per changed pad
+        pads = self.__pads
+        for i in range(len(ADDRESSES)):
+            pad = pads[i]
+            if pad is not None:
+                try:
+                    pad.flush_leds()
+                except OSError:
+                    self.__disconnect(i)
+
+    def supervise(self):
+        # Probe each missing pad that is due, with a single byte read, and only
+        # set it up again once it answers
+        missing = self.__supervised & ~self.__connected
+        if not missing:
+            return self.__connected
+
+        now = time.ticks_ms()
+        for i in range(len(ADDRESSES)):
+            if missing & (1 << i) and time.ticks_diff(now, self.__probe_due[i]) >= 0:
+                try:
+                    self.__i2c.readfrom_mem_into(ADDRESSES[i], QwSTPad.INPUT_PORT0, self.__probe_buffer)
+                except OSError:
+                    self.__backoff[i] = min(self.__backoff[i] * 2, self.MAX_BACKOFF_MS)
+                    self.__schedule_probe(i, self.__backoff[i])
+                    continue
+                self.connect(ADDRESSES[i], self.__show_address)
+        return self.__connected
+
+    def __schedule_probe(self, index, delay_ms):
+        self.__probe_due[index] = time.ticks_add(time.ticks_ms(), delay_ms)
+
+    def __disconnect(self, index):
+        was_connected = self.__pads[index] is not None
+        self.__pads[index] = None
+        self.__buttons[index] = 0
+        self.__connected &= ~(1 << index)
+        if was_connected:
+            self.__schedule_probe(index, self.MIN_BACKOFF_MS)
+            if self.__on_disconnect is not None:
+                self.__on_disconnect(index)
@@ -0,0 +1,157 @@
+import time
+
+import micropython
+from micropython import const
+
+from qwstpad import NUM_LEDS
+
+# Constants
+DEFAULT_FRAME_MS = const(5)
+PWM_LEVELS = const(4)
+ALL_LEDS = const(0b1111)
+
+
+class LedAnimator:
+    def __init__(self, pad, frame_ms=DEFAULT_FRAME_MS):
+        if frame_ms <= 0:
+            raise ValueError("'frame_ms' out of range. Expected greater than 0")
+
+        self.pad = pad
+        self.__frame_ms = frame_ms
+        self.__frames = None
+        self.__loop = False
+        self.__start = 0
+        self.__flashing = False
+        self.__flash_leds = 0
+        self.__flash_until = 0
+        self.__restore_leds = 0
+        self.__timer = None
+        self.__error = None
+
+        # Bound once, as creating it inside the timer callback would allocate
+        self.__update_ref = self.__scheduled_update
+
+    def frames(self, ms):
+        return max(1, ms // self.__frame_ms)
+
+    def play(self, frames, loop=True):
+        if len(frames) == 0:
+            raise ValueError("'frames' must not be empty")
+
+        self.__frames = frames
+        self.__loop = loop
+        self.__start = time.ticks_ms()
+
+    def stop(self, leds=None):
+        self.__frames = None
+        if self.__flashing and leds is None:
+            leds = self.__restore_leds
+        self.__flashing = False
+        if leds is not None:
+            self.pad.set_leds(leds)
+
+    def playing(self):
+        return self.__frames is not None or self.__flashing
+
+    def blink(self, leds=ALL_LEDS, on_ms=250, off_ms=250):
+        frames = bytes([leds]) * self.frames(on_ms) + bytes(self.frames(off_ms))
+        self.play(frames)
+        return frames
+
+    def wave(self, step_ms=200):
+        # Fill the LEDs one at a time, then empty them in the same order
+        steps = []
+        for i in range(1, NUM_LEDS + 1):
+            steps.append((1 << i) - 1)
+        for i in range(1, NUM_LEDS + 1):
+            steps.append(ALL_LEDS & ~((1 << i) - 1))
+        frames = bytearray()
+        for states in steps:
+            frames.extend(bytes([states]) * self.frames(step_ms))
+        self.play(frames)
+        return frames
+
+    def pulse(self, leds=ALL_LEDS, period_ms=1000):
+        # Software PWM, where each cycle of PWM_LEVELS frames has the LEDs lit for
+        # as many frames as the brightness, which ramps up and then back down
+        cycles = max(2, period_ms // (self.__frame_ms * PWM_LEVELS))
+        frames = bytearray()
+        for cycle in range(cycles):
+            position = (2 * cycle * PWM_LEVELS) // cycles
+            brightness = position if position <= PWM_LEVELS else 2 * PWM_LEVELS - position
+            for level in range(PWM_LEVELS):
+                frames.append(leds if level < brightness else 0)
+        self.play(frames)
+        return frames
+
+    def flash(self, leds=ALL_LEDS, ms=100):
+        # Shown over any animation, which carries on underneath. Without one, the
+        # LEDs go back to how they were before the flash once it ends
+        if not self.__flashing:
+            self.__restore_leds = self.pad.led_states()
+        self.__flash_leds = leds
+        self.__flash_until = time.ticks_add(time.ticks_ms(), ms)
+        self.__flashing = True
+
+    def update(self):
+        now = time.ticks_ms()
+        if self.__flashing:
+            if time.ticks_diff(self.__flash_until, now) > 0:
+                self.pad.set_leds(self.__flash_leds)
+                return
+            self.__flashing = False
+            if self.__frames is None:
+                self.pad.set_leds(self.__restore_leds)
+
+        frames = self.__frames
+        if frames is None:
+            return
+
+        index = time.ticks_diff(now, self.__start) // self.__frame_ms
+        if index >= len(frames):
+            if self.__loop:
+                index %= len(frames)
+            else:
+                index = len(frames) - 1
+                self.__frames = None
+
+        # Unchanged states are not written by the pad, so only changes reach the bus
+        self.pad.set_leds(frames[index])
+
+    def attach(self, timer):
+        self.__error = None
+        self.__timer = timer
+        timer.init(period=self.__frame_ms, callback=self.__handle_timer)
+
+    def detach(self):
+        if self.__timer is not None:
+            self.__timer.deinit()
+            self.__timer = None
+
+    def error(self):
+        return self.__error
+
+    async def run(self):
+        try:
+            import asyncio
+        except ImportError:
+            import uasyncio as asyncio
+
+        delay = self.__frame_ms / 1000
+        while True:
+            self.update()
+            await asyncio.sleep(delay)
+
+    def __handle_timer(self, timer):
+        # Timer callbacks may run as interrupts, so the bus is only used once scheduled
+        try:
+            micropython.schedule(self.__update_ref, None)
+        except RuntimeError:
+            pass    # The schedule queue is full, so skip this frame
+
+    def __scheduled_update(self, _):
+        try:
+            self.update()
+        except OSError as e:
+            self.__error = e
+            self.detach()
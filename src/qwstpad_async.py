@@ -0,0 +1,135 @@
+try:
+    import asyncio
+except ImportError:
+    import uasyncio as asyncio
+
+from micropython import const
+
+from qwstpad import NUM_BUTTONS
+
+# Constants
+DEFAULT_POLL_MS = const(10)
+DEFAULT_HISTORY = const(32)
+
+
+class _EventHistory:
+    # The last few changes, each stored as the button's index with the top bit
+    # set for a press. head counts every change ever added, so each stream can
+    # keep its own place in the history without a queue per stream
+    def __init__(self, capacity):
+        self.codes = bytearray(capacity)
+        self.head = 0
+
+    def add(self, changed, buttons):
+        codes = self.codes
+        for i in range(NUM_BUTTONS):
+            bit = 1 << i
+            if changed & bit:
+                codes[self.head % len(codes)] = i | 0x80 if buttons & bit else i
+                self.head += 1
+
+
+class AsyncQwSTPad:
+    def __init__(self, pad, poll_ms=DEFAULT_POLL_MS, history=DEFAULT_HISTORY):
+        if poll_ms <= 0:
+            raise ValueError("'poll_ms' out of range. Expected greater than 0")
+
+        if history <= 0:
+            raise ValueError("'history' out of range. Expected greater than 0")
+
+        self.pad = pad
+        self.__poll_ms = poll_ms
+        self.__changed = asyncio.Event()
+        self.__task = None
+        self.__error = None
+        self.__buttons = 0
+        self.__pressed = 0
+        self.__released = 0
+        self.__history = _EventHistory(history)
+
+    def start(self):
+        if self.__task is None:
+            self.__error = None
+            self.__task = asyncio.create_task(self.__poll())
+        return self.__task
+
+    def stop(self):
+        if self.__task is not None:
+            self.__task.cancel()
+            self.__task = None
+
+    def buttons(self):
+        return self.__buttons
+
+    def events(self):
+        return _EventStream(self, self.__history)
+
+    async def wait_changed(self):
+        if self.__error is None:
+            await self.__changed.wait()
+        if self.__error is not None:
+            raise self.__error
+
+    async def wait_for(self, buttons, pressed=True):
+        while True:
+            await self.wait_changed()
+            changed = (self.__pressed if pressed else self.__released) & buttons
+            if changed:
+                return changed
+
+    async def __poll(self):
+        # An interrupt driven pad only touches the bus after a change, so polling it often stays cheap
+        pad = self.pad
+        delay = self.__poll_ms / 1000
+        while True:
+            try:
+                self.__buttons = pad.read_buttons_mask()
+            except OSError as e:
+                self.__error = e
+                self.__task = None
+                self.__notify()
+                return
+
+            self.__pressed = pad.just_pressed()
+            self.__released = pad.just_released()
+            if self.__pressed | self.__released:
+                self.__history.add(self.__pressed | self.__released, self.__buttons)
+                self.__notify()
+
+            await asyncio.sleep(delay)
+
+    def __notify(self):
+        # Wake everything currently waiting, then re-arm for the next change
+        self.__changed.set()
+        self.__changed.clear()
+
+
+class _EventStream:
+    # Each stream reads the shared history from its own position, so changes made
+    # while its consumer is busy are still reported, up to the history's capacity
+    def __init__(self, owner, history):
+        self.__owner = owner
+        self.__history = history
+        self.__position = history.head
+        self.__overflows = 0
+
+    def __aiter__(self):
+        return self
+
+    def overflows(self):
+        return self.__overflows
+
+    async def __anext__(self):
+        history = self.__history
+        while True:
+            behind = history.head - self.__position
+            if behind > 0:
+                if behind > len(history.codes):
+                    # The oldest changes have been overwritten, so skip to the oldest still held
+                    self.__overflows += behind - len(history.codes)
+                    self.__position = history.head - len(history.codes)
+                code = history.codes[self.__position % len(history.codes)]
+                self.__position += 1
+                return 1 << (code & 0x7F), (code & 0x80) != 0
+
+            await self.__owner.wait_changed()
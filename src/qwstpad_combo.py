@@ -0,0 +1,118 @@
+import time
+from array import array
+
+from micropython import const
+
+from qwstpad import BTN_ALL
+
+# Constants
+MAX_COMBOS = const(16)
+MAX_STEPS = const(255)
+DEFAULT_TIMEOUT_MS = const(500)
+
+
+class ComboMatcher:
+    def __init__(self):
+        self.__definitions = []
+        self.__callbacks = []
+        self.__last = 0
+        self.__compile()
+
+    def add_chord(self, buttons, callback=None):
+        return self.__add((buttons,), 0, callback)
+
+    def add_sequence(self, steps, timeout_ms=DEFAULT_TIMEOUT_MS, callback=None):
+        return self.__add(tuple(steps), timeout_ms, callback)
+
+    def count(self):
+        return len(self.__definitions)
+
+    def reset(self):
+        for i in range(len(self.__progress)):
+            self.__progress[i] = 0
+        self.__active = 0
+
+    def update(self, buttons, ticks=None):
+        pressed = buttons & ~self.__last
+        self.__last = buttons
+
+        # Nothing can advance or time out without a new press or a combo partway through
+        if not pressed and not self.__active:
+            return 0
+
+        if ticks is None:
+            ticks = time.ticks_ms()
+
+        matched = 0
+        bit = 1
+        for i in range(len(self.__progress)):
+            step = self.__progress[i]
+            if step and self.__timeouts[i] and time.ticks_diff(ticks, self.__deadlines[i]) > 0:
+                step = 0
+
+            if pressed:
+                mask = self.__masks[self.__starts[i] + step]
+                if pressed & ~mask:
+                    # A press outside the expected step starts the combo again, perhaps from this press
+                    step = 0
+                    mask = self.__masks[self.__starts[i]]
+
+                if not pressed & ~mask and buttons & mask == mask:
+                    step += 1
+                    if step == self.__lengths[i]:
+                        step = 0
+                        matched |= bit
+                    else:
+                        self.__deadlines[i] = time.ticks_add(ticks, self.__timeouts[i])
+
+            self.__progress[i] = step
+            if step:
+                self.__active |= bit
+            else:
+                self.__active &= ~bit
+            bit <<= 1
+
+        if matched:
+            bit = 1
+            for callback in self.__callbacks:
+                if matched & bit and callback is not None:
+                    callback(matched & bit)
+                bit <<= 1
+
+        return matched
+
+    def __add(self, steps, timeout_ms, callback):
+        if len(self.__definitions) >= MAX_COMBOS:
+            raise ValueError("too many combos. Expected at most 16")
+
+        if len(steps) == 0 or len(steps) > MAX_STEPS:
+            raise ValueError("'steps' out of range. Expected 1 to 255 steps")
+
+        for step in steps:
+            if step <= 0 or step & ~BTN_ALL:
+                raise ValueError("combo steps must be masks of BTN_ constants")
+
+        if timeout_ms < 0 or timeout_ms > 0xFFFF:
+            raise ValueError("'timeout_ms' out of range. Expected 0 to 65535")
+
+        self.__definitions.append((steps, timeout_ms))
+        self.__callbacks.append(callback)
+        self.__compile()
+        return 1 << (len(self.__definitions) - 1)
+
+    def __compile(self):
+        # Flatten the definitions into tables, so matching only indexes arrays
+        masks = []
+        starts = []
+        for steps, _ in self.__definitions:
+            starts.append(len(masks))
+            masks.extend(steps)
+
+        count = len(self.__definitions)
+        self.__masks = array("H", masks)
+        self.__starts = array("H", starts)
+        self.__lengths = bytearray(len(steps) for steps, _ in self.__definitions)
+        self.__timeouts = array("H", [timeout_ms for _, timeout_ms in self.__definitions])
+        self.__deadlines = array("L", [0] * count)
+        self.__progress = bytearray(count)
+        self.__active = 0
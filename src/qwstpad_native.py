@@ -0,0 +1,19 @@
+import micropython
+
+# Viper versions of the register decode and encode used by qwstpad. These are
+# only imported on ports with a native emitter, with qwstpad falling back to
+# its own pure Python versions everywhere else.
+
+
+@micropython.viper
+def decode(low, high, state: int) -> int:
+    low_table = ptr16(low)
+    high_table = ptr16(high)
+    return int(low_table[state & 0xFF] | high_table[(state >> 8) & 0xFF])
+
+
+@micropython.viper
+def encode(buffer, value: int):
+    data = ptr8(buffer)
+    data[0] = value
+    data[1] = value >> 8
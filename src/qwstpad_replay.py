@@ -0,0 +1,212 @@
+import struct
+import time
+from array import array
+
+from micropython import const
+
+from qwstpad import ADDRESSES, QwSTPad
+
+# Constants
+DEFAULT_CAPACITY = const(1024)
+FORMAT_VERSION = const(1)
+
+# File header: magic, format version, number of samples. The samples follow
+# as all the times, then all the pads, then all the values
+_MAGIC = b"QWSR"
+_HEADER = "<4sBI"
+_HEADER_SIZE = const(9)
+_TIME = "<I"
+_TIME_SIZE = const(4)
+_VALUE = "<H"
+_VALUE_SIZE = const(2)
+
+# The errno MicroPython raises when a device does not acknowledge
+_EIO = const(5)
+
+
+class Recording:
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        if capacity <= 0:
+            raise ValueError("'capacity' out of range. Expected greater than 0")
+
+        # Each sample is the time since recording started, which pad it came from, and its raw input port value
+        self.times = array("I", [0] * capacity)
+        self.pads = bytearray(capacity)
+        self.values = array("H", [0] * capacity)
+        self.length = 0
+        self.overflows = 0
+
+    def __len__(self):
+        return self.length
+
+    def capacity(self):
+        return len(self.values)
+
+    def clear(self):
+        self.length = 0
+        self.overflows = 0
+
+    def append(self, ms, index, value):
+        if self.length >= len(self.values):
+            self.overflows += 1
+            return False
+
+        self.times[self.length] = ms
+        self.pads[self.length] = index
+        self.values[self.length] = value
+        self.length += 1
+        return True
+
+    def duration(self):
+        return self.times[self.length - 1] if self.length else 0
+
+    def save(self, file):
+        # Each field is packed little endian at a fixed size, so a recording made
+        # on a board can be loaded on a host, whatever size its arrays use
+        length = self.length
+        file.write(struct.pack(_HEADER, _MAGIC, FORMAT_VERSION, length))
+
+        data = bytearray(_TIME_SIZE * length)
+        for i in range(length):
+            struct.pack_into(_TIME, data, _TIME_SIZE * i, self.times[i])
+        file.write(data)
+
+        file.write(memoryview(self.pads)[:length])
+
+        data = bytearray(_VALUE_SIZE * length)
+        for i in range(length):
+            struct.pack_into(_VALUE, data, _VALUE_SIZE * i, self.values[i])
+        file.write(data)
+
+    @classmethod
+    def load(cls, file):
+        header = file.read(_HEADER_SIZE)
+        if len(header) != _HEADER_SIZE:
+            raise ValueError("file is not a QwSTPad recording")
+
+        magic, version, length = struct.unpack(_HEADER, header)
+        if magic != _MAGIC or version != FORMAT_VERSION:
+            raise ValueError("file is not a QwSTPad recording")
+
+        times = file.read(_TIME_SIZE * length)
+        pads = file.read(length)
+        values = file.read(_VALUE_SIZE * length)
+        if len(times) != _TIME_SIZE * length or len(pads) != length or len(values) != _VALUE_SIZE * length:
+            raise ValueError("recording is shorter than its header says")
+
+        recording = cls(max(length, 1))
+        for i in range(length):
+            recording.times[i] = struct.unpack_from(_TIME, times, _TIME_SIZE * i)[0]
+            recording.pads[i] = pads[i]
+            recording.values[i] = struct.unpack_from(_VALUE, values, _VALUE_SIZE * i)[0]
+        recording.length = length
+        return recording
+
+
+class RecordingI2C:
+    # Sits between the pads and the real bus, so one recorder captures every pad it serves
+    def __init__(self, i2c, recording=None):
+        self.i2c = i2c
+        self.recording = recording if recording is not None else Recording()
+        self.__last = array("l", [-1] * len(ADDRESSES))
+        self.__start = time.ticks_ms()
+
+    def restart(self):
+        self.recording.clear()
+        for i in range(len(ADDRESSES)):
+            self.__last[i] = -1
+        self.__start = time.ticks_ms()
+
+    def readfrom_mem_into(self, address, reg, buf, *args):
+        self.i2c.readfrom_mem_into(address, reg, buf, *args)
+
+        # Only changes are stored, which keeps recordings of held buttons small
+        if reg == QwSTPad.INPUT_PORT0 and len(buf) == 2 and address in ADDRESSES:
+            index = ADDRESSES.index(address)
+            value = buf[0] | (buf[1] << 8)
+            if value != self.__last[index]:
+                self.__last[index] = value
+                self.recording.append(time.ticks_diff(time.ticks_ms(), self.__start), index, value)
+
+    def __getattr__(self, name):
+        return getattr(self.i2c, name)
+
+
+class ReplayI2C:
+    # Stands in for the bus, playing a recording back to any QwSTPad or QwSTPadBus created on it
+    def __init__(self, recording, speed=1, loop=False):
+        if speed <= 0:
+            raise ValueError("'speed' out of range. Expected greater than 0")
+
+        self.recording = recording
+        self.loop = loop
+        # Speed is kept in 1/256ths, so scaling the clock needs no floats
+        self.__speed = int(speed * 256)
+        self.__registers = [None] * len(ADDRESSES)
+        self.__inputs = array("l", [-1] * len(ADDRESSES))
+        for i in range(len(recording)):
+            index = recording.pads[i]
+            if self.__registers[index] is None:
+                self.__registers[index] = bytearray(8)
+        self.restart()
+
+    def restart(self):
+        self.__start = time.ticks_ms()
+        self.__cursor = 0
+
+    def position(self):
+        return (time.ticks_diff(time.ticks_ms(), self.__start) * self.__speed) >> 8
+
+    def finished(self):
+        return self.__cursor >= len(self.recording)
+
+    def output(self, address):
+        # The last value written to a pad's output port, to check what its LEDs were set to
+        registers = self.__registers[ADDRESSES.index(address)]
+        return registers[QwSTPad.OUTPUT_PORT0] | (registers[QwSTPad.OUTPUT_PORT1] << 8)
+
+    def scan(self):
+        return [ADDRESSES[i] for i in range(len(ADDRESSES)) if self.__registers[i] is not None]
+
+    def readfrom_mem_into(self, address, reg, buf, *args):
+        registers = self.__device(address)
+        if reg == QwSTPad.INPUT_PORT0 or reg == QwSTPad.INPUT_PORT1:
+            self.__advance()
+            value = self.__inputs[ADDRESSES.index(address)]
+            value = max(value, 0)
+            for i in range(len(buf)):
+                buf[i] = value >> 8 if reg & 1 else value & 0xFF
+                reg ^= 1
+        else:
+            for i in range(len(buf)):
+                buf[i] = registers[reg]
+                reg ^= 1
+
+    def readfrom_mem(self, address, reg, nbytes, *args):
+        buf = bytearray(nbytes)
+        self.readfrom_mem_into(address, reg, buf)
+        return bytes(buf)
+
+    def writeto_mem(self, address, reg, buf, *args):
+        registers = self.__device(address)
+        for value in buf:
+            registers[reg] = value
+            reg ^= 1
+
+    def __device(self, address):
+        registers = self.__registers[ADDRESSES.index(address)] if address in ADDRESSES else None
+        if registers is None:
+            raise OSError(_EIO)
+        return registers
+
+    def __advance(self):
+        recording = self.recording
+        if self.loop and self.finished() and len(recording) and self.position() > recording.duration():
+            self.restart()
+
+        now = self.position()
+        cursor = self.__cursor
+        while cursor < len(recording) and recording.times[cursor] <= now:
+            self.__inputs[recording.pads[cursor]] = recording.values[cursor]
+            cursor += 1
+        self.__cursor = cursor
@@ -0,0 +1,96 @@
+import _thread
+import time
+
+from micropython import const
+
+# Constants
+DEFAULT_POLL_MS = const(5)
+
+
+class ThreadedQwSTPad:
+    def __init__(self, pad, poll_ms=DEFAULT_POLL_MS):
+        if poll_ms <= 0:
+            raise ValueError("'poll_ms' out of range. Expected greater than 0")
+
+        self.pad = pad
+        self.__delay = poll_ms / 1000
+        self.__lock = _thread.allocate_lock()
+        self.__running = False
+        self.__stopping = False
+        self.__error = None
+
+        # Written by the sampler, with presses and releases gathered until the next read
+        self.__sampled = 0
+        self.__pressed = 0
+        self.__released = 0
+
+        # What the last read took from the sampler
+        self.__buttons = 0
+        self.__just_pressed = 0
+        self.__just_released = 0
+
+    def start(self):
+        if not self.__running:
+            self.__error = None
+            self.__stopping = False
+            self.__running = True
+            _thread.start_new_thread(self.__sample, ())
+
+    def stop(self):
+        self.__stopping = True
+        while self.__running:
+            time.sleep(self.__delay)
+
+    def running(self):
+        return self.__running
+
+    def read_buttons_mask(self):
+        if self.__error is not None:
+            raise self.__error
+
+        with self.__lock:
+            self.__buttons = self.__sampled
+            self.__just_pressed = self.__pressed
+            self.__just_released = self.__released
+            self.__pressed = 0
+            self.__released = 0
+        return self.__buttons
+
+    def just_pressed(self):
+        return self.__just_pressed
+
+    def just_released(self):
+        return self.__just_released
+
+    def read_event(self):
+        # The pad's queue has a single reader and writer, so needs no lock
+        return self.pad.read_event()
+
+    def set_leds(self, states, force=False):
+        with self.__lock:
+            self.pad.set_leds(states, force)
+
+    def set_led(self, led, state, force=False):
+        with self.__lock:
+            self.pad.set_led(led, state, force)
+
+    def clear_leds(self, force=False):
+        with self.__lock:
+            self.pad.clear_leds(force)
+
+    def __sample(self):
+        # The pad is only used while holding the lock, so LED writes from the other core never interleave with reads
+        pad = self.pad
+        try:
+            while not self.__stopping:
+                with self.__lock:
+                    buttons = pad.read_buttons_mask()
+                    changed = buttons ^ self.__sampled
+                    self.__pressed |= changed & buttons
+                    self.__released |= changed & self.__sampled
+                    self.__sampled = buttons
+                time.sleep(self.__delay)
+        except OSError as e:
+            self.__error = e
+        finally:
+            self.__running = False
@@ -1,7 +1,9 @@
 import sys
+import time
 
 import mock
 import pytest
+from tca9555 import FakeI2C, FakePin
 
 
 @pytest.fixture(scope="function", autouse=False)
@@ -18,3 +20,42 @@ def micropython():
     yield sys.modules["micropython"]
     del sys.modules["micropython"]
 
+
+@pytest.fixture(scope="function", autouse=False)
+def i2c():
+    yield FakeI2C()
+
+
+@pytest.fixture(scope="function", autouse=False)
+def pin():
+    yield FakePin()
+
+
+class FakeTicks:
+    def __init__(self):
+        self.ms = 0
+
+    def advance(self, ms):
+        self.ms += ms
+
+    def ticks_ms(self):
+        return self.ms
+
+    def ticks_us(self):
+        return self.ms * 1000
+
+    @staticmethod
+    def ticks_add(ticks, delta):
+        return ticks + delta
+
+    @staticmethod
+    def ticks_diff(ticks1, ticks2):
+        return ticks1 - ticks2
+
+
+@pytest.fixture(scope="function", autouse=False)
+def ticks(monkeypatch):
+    fake = FakeTicks()
+    for name in ("ticks_ms", "ticks_us", "ticks_add", "ticks_diff"):
+        monkeypatch.setattr(time, name, getattr(fake, name), raising=False)
+    yield fake
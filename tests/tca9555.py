@@ -0,0 +1,203 @@
+"""
+A simulated TCA9555 I/O expander and I2C bus, for testing and benchmarking
+QwSTPad without hardware. Written to run on both CPython and MicroPython.
+"""
+
+# Registers
+INPUT_PORT0 = 0x00
+INPUT_PORT1 = 0x01
+OUTPUT_PORT0 = 0x02
+OUTPUT_PORT1 = 0x03
+POLARITY_PORT0 = 0x04
+POLARITY_PORT1 = 0x05
+CONFIGURATION_PORT0 = 0x06
+CONFIGURATION_PORT1 = 0x07
+NUM_REGISTERS = 8
+
+# Power-on values of each register pair, from the datasheet
+POWER_ON = {OUTPUT_PORT0: 0xFFFF, POLARITY_PORT0: 0x0000, CONFIGURATION_PORT0: 0xFFFF}
+
+# The errno MicroPython raises when a device does not acknowledge
+EIO = 5
+
+
+class FakePin:
+    IRQ_FALLING = 4
+    IRQ_RISING = 8
+
+    def __init__(self):
+        self.handler = None
+        self.trigger = None
+        self.calls = 0
+
+    def irq(self, handler=None, trigger=IRQ_FALLING | IRQ_RISING):
+        self.handler = handler
+        self.trigger = trigger
+
+    def change(self):
+        self.calls += 1
+        if self.handler is not None:
+            self.handler(self)
+
+
+class SimulatedTCA9555:
+    def __init__(self, address):
+        self.address = address
+        self.connected = True
+        self.interrupt = None
+        self.registers = bytearray(NUM_REGISTERS)
+        self.reset()
+
+    def reset(self):
+        # Return to the power-on state, with every button released
+        for reg, value in POWER_ON.items():
+            self.registers[reg] = value & 0xFF
+            self.registers[reg + 1] = value >> 8
+        self.levels = 0xFFFF
+        self.frames = []
+        self.__read_levels = self.levels
+        self.__asserted = False
+
+    def press(self, *pins):
+        # Buttons pull their pin low, so a pressed button reads as 0 before polarity inversion
+        levels = 0xFFFF
+        for pin in pins:
+            levels &= ~(1 << pin)
+        self.__set_levels(levels)
+
+    def script(self, frames):
+        # Queue up button presses, one tuple of pins per read of the input port
+        self.frames = list(frames)
+
+    def register(self, reg):
+        reg &= ~1
+        return self.registers[reg] | (self.registers[reg + 1] << 8)
+
+    def input(self):
+        config = self.register(CONFIGURATION_PORT0)
+        polarity = self.register(POLARITY_PORT0)
+        # Output pins read back the level they are driving, and only inputs are inverted
+        levels = (self.levels & config) | (self.register(OUTPUT_PORT0) & ~config)
+        return (levels ^ (polarity & config)) & 0xFFFF
+
+    def read(self, reg, nbytes):
+        data = bytearray(nbytes)
+        self.read_into(reg, data)
+        return data
+
+    def read_into(self, reg, buf):
+        if reg == INPUT_PORT0 and self.frames:
+            self.press(*self.frames.pop(0))
+
+        for i in range(len(buf)):
+            if reg == INPUT_PORT0 or reg == INPUT_PORT1:
+                value = self.input()
+                buf[i] = value >> 8 if reg & 1 else value & 0xFF
+                self.__read_levels = self.levels
+                self.__asserted = False
+            else:
+                buf[i] = self.registers[reg]
+            # The register pointer toggles within a pair rather than moving on to the next pair
+            reg ^= 1
+
+    def write(self, reg, data):
+        for value in data:
+            if reg != INPUT_PORT0 and reg != INPUT_PORT1:
+                self.registers[reg] = value
+            reg ^= 1
+
+    def __set_levels(self, levels):
+        self.levels = levels
+        config = self.register(CONFIGURATION_PORT0)
+        # INT goes low when an input differs from when the input port was last read
+        if (levels ^ self.__read_levels) & config:
+            if not self.__asserted:
+                self.__asserted = True
+                if self.interrupt is not None:
+                    self.interrupt.change()
+        else:
+            self.__asserted = False
+
+
+class FakeI2C:
+    def __init__(self, addresses=(0x21, 0x23, 0x25, 0x27), log=True):
+        self.devices = {}
+        for address in addresses:
+            self.devices[address] = SimulatedTCA9555(address)
+        self.log = [] if log else None
+        self.last_buffer = None
+        self.buffers_seen = 0
+        self.failures = 0
+        self.reset_counts()
+
+    def reset_counts(self):
+        self.reads = 0
+        self.writes = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        if self.log is not None:
+            self.log.clear()
+
+    def transactions(self):
+        return self.reads + self.writes
+
+    def device(self, address):
+        return self.devices[address]
+
+    def press(self, address, *pins):
+        self.devices[address].press(*pins)
+
+    def connect(self, address):
+        self.devices[address].connected = True
+
+    def disconnect(self, address):
+        self.devices[address].connected = False
+
+    def fail_next(self, count=1):
+        self.failures = count
+
+    def scan(self):
+        return [address for address, device in sorted(self.devices.items()) if device.connected]
+
+    def readfrom_mem(self, address, reg, nbytes, addrsize=8):
+        buf = bytearray(nbytes)
+        self.readfrom_mem_into(address, reg, buf)
+        return bytes(buf)
+
+    def readfrom_mem_into(self, address, reg, buf, addrsize=8):
+        # Reading into the caller's buffer keeps the simulation from allocating on the caller's behalf
+        self.__device(address, "read", reg, len(buf)).read_into(reg, buf)
+        self.reads += 1
+        self.bytes_read += len(buf)
+        if buf is not self.last_buffer:
+            self.last_buffer = buf
+            self.buffers_seen += 1
+
+    def writeto_mem(self, address, reg, buf, addrsize=8):
+        self.__device(address, "write", reg, len(buf)).write(reg, buf)
+        self.writes += 1
+        self.bytes_written += len(buf)
+
+    def readfrom_into(self, address, buf):
+        self.__device(address, "read", None, len(buf))
+        self.reads += 1
+        self.bytes_read += len(buf)
+
+    def writeto(self, address, buf):
+        self.__device(address, "write", None, len(buf))
+        self.writes += 1
+        self.bytes_written += len(buf)
+        return 1
+
+    def __device(self, address, op, reg, nbytes):
+        if self.log is not None:
+            self.log.append((op, address, reg, nbytes))
+
+        if self.failures > 0:
+            self.failures -= 1
+            raise OSError(EIO)
+
+        device = self.devices.get(address)
+        if device is None or not device.connected:
+            raise OSError(EIO)
+        return device
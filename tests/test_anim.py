@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+
+def test_blink(i2c, micropython, ticks):
+    import qwstpad
+    from qwstpad_anim import LedAnimator
+
+    pad = qwstpad.QwSTPad(i2c)
+    anim = LedAnimator(pad, frame_ms=10)
+    frames = anim.blink(0b0101, on_ms=30, off_ms=20)
+    assert frames == bytes([0b0101] * 3 + [0] * 2)
+
+    i2c.reset_counts()
+    for _ in range(10):
+        anim.update()
+        ticks.advance(10)
+
+    # Only the four changes are written
+    assert i2c.writes == 4
+
+
+def test_flash_and_one_shot(i2c, micropython, ticks):
+    import qwstpad
+    from qwstpad_anim import LedAnimator
+
+    pad = qwstpad.QwSTPad(i2c)
+    anim = LedAnimator(pad, frame_ms=10)
+    anim.play(b"\x01\x02\x04\x08", loop=False)
+    anim.flash(0b1111, ms=20)
+
+    states = []
+    for _ in range(5):
+        anim.update()
+        states.append(i2c.device(qwstpad.DEFAULT_ADDRESS).register(qwstpad.QwSTPad.OUTPUT_PORT0))
+        ticks.advance(10)
+
+    # The animation carries on under the flash, and holds its last frame once finished
+    led_3, led_4 = (0b00000110_11000000 & ~(1 << pin) for pin in (0x9, 0xA))
+    assert states == [0, 0, led_3, led_4, led_4]
+    assert not anim.playing()
+
+
+def test_pulse(micropython, ticks):
+    from qwstpad_anim import PWM_LEVELS, LedAnimator
+
+    frames = LedAnimator(None, frame_ms=5).pulse(0b0001, period_ms=200)
+
+    duty = [sum(frames[i:i + PWM_LEVELS]) for i in range(0, len(frames), PWM_LEVELS)]
+    assert duty == [0, 0, 1, 2, 3, 4, 4, 3, 2, 1]
+
+
+def test_run(i2c, micropython, ticks):
+    import qwstpad
+    from qwstpad_anim import LedAnimator
+
+    anim = LedAnimator(qwstpad.QwSTPad(i2c), frame_ms=1)
+    anim.blink(on_ms=1, off_ms=1)
+
+    async def main():
+        task = asyncio.create_task(anim.run())
+        await asyncio.sleep(0.02)
+        task.cancel()
+
+    i2c.reset_counts()
+    asyncio.run(main())
+    assert i2c.writes > 0
+
+
+def test_invalid(micropython):
+    from qwstpad_anim import LedAnimator
+
+    with pytest.raises(ValueError):
+        LedAnimator(None, frame_ms=0)
+    with pytest.raises(ValueError):
+        LedAnimator(None).play(b"")
+
+
+def test_flash_without_animation(i2c, micropython, ticks):
+    import qwstpad
+    from qwstpad_anim import LedAnimator
+
+    pad = qwstpad.QwSTPad(i2c)
+    device = i2c.device(qwstpad.DEFAULT_ADDRESS)
+    address_output = device.register(qwstpad.QwSTPad.OUTPUT_PORT0)
+    anim = LedAnimator(pad, frame_ms=10)
+
+    anim.flash(0b1111, ms=20)
+    anim.update()
+    assert device.register(qwstpad.QwSTPad.OUTPUT_PORT0) == 0
+    ticks.advance(20)
+    anim.update()
+    assert device.register(qwstpad.QwSTPad.OUTPUT_PORT0) == address_output
+    assert not anim.playing()
+
+    # Stopping part way through a flash also puts the LEDs back
+    anim.flash(0b1111, ms=20)
+    anim.update()
+    anim.stop()
+    assert device.register(qwstpad.QwSTPad.OUTPUT_PORT0) == address_output
@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+
+async def press_sequence(i2c, address, *presses):
+    for pins in presses:
+        await asyncio.sleep(0.01)
+        i2c.press(address, *pins)
+
+
+def test_events(i2c, micropython):
+    import qwstpad
+    from qwstpad_async import AsyncQwSTPad
+
+    async def main():
+        pad = AsyncQwSTPad(qwstpad.QwSTPad(i2c), poll_ms=1)
+        pad.start()
+        events = []
+        asyncio.create_task(press_sequence(i2c, qwstpad.DEFAULT_ADDRESS, (0xE,), (0xE, 0x1), ()))
+        async for event in pad.events():
+            events.append(event)
+            if len(events) == 4:
+                break
+        pad.stop()
+        return events
+
+    assert asyncio.run(main()) == [(qwstpad.BTN_A, True), (qwstpad.BTN_U, True),
+                                   (qwstpad.BTN_A, False), (qwstpad.BTN_U, False)]
+
+
+def test_wait_for(i2c, micropython):
+    import qwstpad
+    from qwstpad_async import AsyncQwSTPad
+
+    async def main():
+        pad = AsyncQwSTPad(qwstpad.QwSTPad(i2c), poll_ms=1)
+        pad.start()
+        asyncio.create_task(press_sequence(i2c, qwstpad.DEFAULT_ADDRESS, (0xE,), (0xE, 0xB), (0xE,)))
+        pressed = await pad.wait_for(qwstpad.BTN_PLUS)
+        released = await pad.wait_for(qwstpad.BTN_PLUS | qwstpad.BTN_MINUS, pressed=False)
+        pad.stop()
+        return pressed, released
+
+    assert asyncio.run(main()) == (qwstpad.BTN_PLUS, qwstpad.BTN_PLUS)
+
+
+def test_disconnect(i2c, micropython):
+    import qwstpad
+    from qwstpad_async import AsyncQwSTPad
+
+    async def main():
+        pad = AsyncQwSTPad(qwstpad.QwSTPad(i2c), poll_ms=1)
+        pad.start()
+        await asyncio.sleep(0.01)
+        i2c.disconnect(qwstpad.DEFAULT_ADDRESS)
+        await pad.wait_for(qwstpad.BTN_A)
+
+    with pytest.raises(OSError):
+        asyncio.run(main())
+
+
+def test_events_slow_consumer(i2c, micropython):
+    import qwstpad
+    from qwstpad_async import AsyncQwSTPad
+
+    async def main():
+        pad = AsyncQwSTPad(qwstpad.QwSTPad(i2c), poll_ms=1)
+        pad.start()
+        events = []
+        asyncio.create_task(press_sequence(i2c, qwstpad.DEFAULT_ADDRESS, (0xE,), (), (0xC,), ()))
+        async for event in pad.events():
+            events.append(event)
+            if len(events) == 4:
+                break
+            # Busy for longer than the whole sequence of taps
+            await asyncio.sleep(0.05)
+        pad.stop()
+        return events
+
+    assert asyncio.run(main()) == [(qwstpad.BTN_A, True), (qwstpad.BTN_A, False),
+                                   (qwstpad.BTN_B, True), (qwstpad.BTN_B, False)]
+
+
+def test_events_overflow(i2c, micropython):
+    import qwstpad
+    from qwstpad_async import AsyncQwSTPad
+
+    async def main():
+        pad = AsyncQwSTPad(qwstpad.QwSTPad(i2c), poll_ms=1, history=2)
+        pad.start()
+        stream = pad.events()
+        await press_sequence(i2c, qwstpad.DEFAULT_ADDRESS, (0xE,), (), (0xC,), ())
+        await asyncio.sleep(0.01)
+        events = [await stream.__anext__(), await stream.__anext__()]
+        pad.stop()
+        return events, stream.overflows()
+
+    assert asyncio.run(main()) == ([(qwstpad.BTN_B, True), (qwstpad.BTN_B, False)], 2)
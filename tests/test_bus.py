@@ -0,0 +1,114 @@
+import pytest
+
+
+def test_bus_poll(i2c, ticks, micropython):
+    import qwstpad
+    i2c.disconnect(qwstpad.ALT_ADDRESS_2)
+    bus = qwstpad.QwSTPadBus(i2c)
+    assert bus.connected() == 0b1011
+    assert bus.pad(2) is None
+
+    i2c.press(qwstpad.DEFAULT_ADDRESS, 0xE)
+    i2c.press(qwstpad.ALT_ADDRESS_3, 0x1)
+    reads = i2c.reads
+    buttons = bus.poll()
+    assert i2c.reads == reads + 3
+    assert list(buttons) == [qwstpad.BTN_A, 0, 0, qwstpad.BTN_U]
+    assert bus.poll() is buttons
+
+
+def test_bus_disconnect(i2c, ticks, micropython):
+    import qwstpad
+    bus = qwstpad.QwSTPadBus(i2c)
+    i2c.press(qwstpad.ALT_ADDRESS_1, 0xC)
+    bus.poll()
+    pad = bus.pad(1)
+    pad.set_repeat(300, 100)
+
+    i2c.disconnect(qwstpad.ALT_ADDRESS_1)
+    assert list(bus.poll()) == [0, 0, 0, 0]
+    assert bus.connected() == 0b1101
+
+    i2c.connect(qwstpad.ALT_ADDRESS_1)
+    i2c.device(qwstpad.ALT_ADDRESS_1).reset()
+    assert bus.connect(qwstpad.ALT_ADDRESS_1) is pad
+    assert bus.pad(1) is pad
+    assert i2c.device(qwstpad.ALT_ADDRESS_1).register(qwstpad.QwSTPad.CONFIGURATION_PORT0) == 0b11111001_00111111
+    assert bus.connected() == 0b1111
+
+
+def test_bus_flush(i2c, micropython):
+    import qwstpad
+    bus = qwstpad.QwSTPadBus(i2c)
+    writes = i2c.writes
+
+    for i in range(4):
+        bus.pad(i).set_leds(0b1111)
+        bus.pad(i).set_leds(bus.pad(i).address_code())
+    bus.pad(0).set_leds(0b1111)
+    assert i2c.writes == writes
+
+    bus.flush()
+    assert i2c.writes == writes + 1
+    assert i2c.device(qwstpad.DEFAULT_ADDRESS).register(qwstpad.QwSTPad.OUTPUT_PORT0) == 0
+
+
+def test_bus_supervise(i2c, ticks, micropython):
+    import qwstpad
+    events = []
+    i2c.disconnect(qwstpad.ALT_ADDRESS_3)
+    bus = qwstpad.QwSTPadBus(i2c,
+                             on_connect=lambda index, pad: events.append(("connect", index)),
+                             on_disconnect=lambda index: events.append(("disconnect", index)))
+    assert events == [("connect", 0), ("connect", 1), ("connect", 2)]
+
+    # Connecting a pad that is already connected neither sets it up again nor reports it
+    i2c.reset_counts()
+    assert bus.connect(qwstpad.DEFAULT_ADDRESS) is bus.pad(0)
+    assert i2c.transactions() == 0
+    assert len(events) == 3
+
+    # A missing pad is probed with a single one byte read, backing off after each failure
+    i2c.reset_counts()
+    probes = []
+    for _ in range(160):
+        before = len(i2c.log)
+        bus.supervise()
+        if len(i2c.log) != before:
+            probes.append(ticks.ms)
+        ticks.advance(10)
+    assert probes == [100, 300, 700, 1500]
+    assert i2c.log == [("read", qwstpad.ALT_ADDRESS_3, qwstpad.QwSTPad.INPUT_PORT0, 1)] * 4
+
+    # Once it answers it is set up again, and reported
+    ticks.advance(3200)
+    i2c.connect(qwstpad.ALT_ADDRESS_3)
+    assert bus.supervise() == 0b1111
+    assert events[-1] == ("connect", 3)
+    assert i2c.device(qwstpad.ALT_ADDRESS_3).register(qwstpad.QwSTPad.CONFIGURATION_PORT0) == 0b11111001_00111111
+
+    # Losing a pad is reported once, and it is looked for again soon after
+    i2c.disconnect(qwstpad.DEFAULT_ADDRESS)
+    bus.poll()
+    bus.poll()
+    assert events[-1] == ("disconnect", 0)
+    assert events.count(("disconnect", 0)) == 1
+    ticks.advance(100)
+    i2c.connect(qwstpad.DEFAULT_ADDRESS)
+    assert bus.supervise() == 0b1111
+
+
+def test_bus_supervise_only_requested(i2c, ticks, micropython):
+    import qwstpad
+    bus = qwstpad.QwSTPadBus(i2c, addresses=(qwstpad.DEFAULT_ADDRESS,))
+    i2c.reset_counts()
+    ticks.advance(1000)
+    assert bus.supervise() == 0b0001
+    assert i2c.transactions() == 0
+
+
+def test_bus_invalid_address(i2c, ticks, micropython):
+    import qwstpad
+
+    with pytest.raises(ValueError, match="address is not valid"):
+        qwstpad.QwSTPadBus(i2c, (qwstpad.DEFAULT_ADDRESS, 0x22))
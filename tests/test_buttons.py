@@ -0,0 +1,108 @@
+import tracemalloc
+
+import pytest
+
+
+def test_read_buttons(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c)
+    i2c.press(qwstpad.DEFAULT_ADDRESS, 0xE, 0x1)
+    buttons = pad.read_buttons()
+    assert [key for key, value in buttons.items() if value] == ['A', 'U']
+
+
+def test_read_buttons_reuses_buffers(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c)
+    # Keep the mask below 256 so CPython's cached small ints stand in for MicroPython's unboxed ones
+    i2c.press(qwstpad.DEFAULT_ADDRESS, 0xC, 0x1)
+    first = pad.read_buttons()
+    i2c.log = None
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for _ in range(100):
+            buttons = pad.read_buttons()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    assert buttons is first
+    assert after == before
+    assert i2c.buffers_seen == 1
+
+
+def test_read_buttons_mask(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c)
+    i2c.press(qwstpad.DEFAULT_ADDRESS, 0xF, 0x3, 0x5)
+    assert pad.read_buttons_mask() == qwstpad.BTN_X | qwstpad.BTN_R | qwstpad.BTN_MINUS
+
+
+def test_read_buttons_mask_order(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c)
+    for i, pin in enumerate(qwstpad.QwSTPad.BUTTON_MAPPING.values()):
+        i2c.press(qwstpad.DEFAULT_ADDRESS, pin)
+        assert pad.read_buttons_mask() == 1 << i
+
+    i2c.press(qwstpad.DEFAULT_ADDRESS, *range(16))
+    assert pad.read_buttons_mask() == qwstpad.BTN_ALL
+
+
+def test_edges(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c)
+    address = qwstpad.DEFAULT_ADDRESS
+
+    i2c.press(address, 0xE)
+    pad.read_buttons_mask()
+    assert pad.just_pressed() == qwstpad.BTN_A
+    assert pad.just_released() == 0
+    assert pad.held() == 0
+
+    i2c.press(address, 0xE, 0x1)
+    pad.read_buttons()
+    assert pad.just_pressed() == qwstpad.BTN_U
+    assert pad.held() == qwstpad.BTN_A
+
+    i2c.press(address, 0x1)
+    pad.read_buttons_mask()
+    assert pad.just_pressed() == 0
+    assert pad.just_released() == qwstpad.BTN_A
+    assert pad.held() == qwstpad.BTN_U
+
+
+def test_mask_to_dict(micropython):
+    import qwstpad
+    states = qwstpad.mask_to_dict(qwstpad.BTN_B | qwstpad.BTN_PLUS)
+    assert list(states.keys()) == list(qwstpad.QwSTPad.BUTTON_MAPPING.keys())
+    assert [key for key, value in states.items() if value] == ['B', '+']
+
+
+def test_button_state(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c)
+    i2c.press(qwstpad.DEFAULT_ADDRESS, 0xE, 0xB)
+    buttons = pad.read_buttons()
+
+    assert buttons["A"] and buttons.A and buttons["+"]
+    assert not buttons.B
+    assert list(buttons) == list(qwstpad.QwSTPad.BUTTON_MAPPING)
+    assert buttons == qwstpad.mask_to_dict(qwstpad.BTN_A | qwstpad.BTN_PLUS)
+
+    snapshot = buttons.snapshot()
+    i2c.press(qwstpad.DEFAULT_ADDRESS)
+    pad.read_buttons()
+    assert not buttons.A
+    assert snapshot.A and snapshot.mask == qwstpad.BTN_A | qwstpad.BTN_PLUS
+
+    with pytest.raises(AttributeError):
+        snapshot.mask = 0
+    with pytest.raises(AttributeError):
+        snapshot.A = False
+
+    assert snapshot.get("A") and snapshot.get("+")
+    assert not snapshot.get("B")
+    assert snapshot.get("Z", "missing") == "missing"
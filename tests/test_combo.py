@@ -0,0 +1,56 @@
+import pytest
+
+
+def test_chord(micropython, ticks):
+    import qwstpad
+    from qwstpad_combo import ComboMatcher
+
+    fired = []
+    combos = ComboMatcher()
+    pause = combos.add_chord(qwstpad.BTN_PLUS | qwstpad.BTN_MINUS, fired.append)
+
+    assert combos.update(qwstpad.BTN_PLUS) == 0
+    assert combos.update(qwstpad.BTN_PLUS | qwstpad.BTN_MINUS) == pause
+    assert combos.update(qwstpad.BTN_PLUS | qwstpad.BTN_MINUS) == 0
+    assert fired == [pause]
+
+
+def test_sequence(micropython, ticks):
+    import qwstpad
+    from qwstpad_combo import ComboMatcher
+
+    combos = ComboMatcher()
+    combos.add_chord(qwstpad.BTN_A | qwstpad.BTN_B)
+    dash = combos.add_sequence((qwstpad.BTN_R, qwstpad.BTN_R, qwstpad.BTN_A), timeout_ms=200)
+
+    matched = 0
+    for buttons in (qwstpad.BTN_R, 0, qwstpad.BTN_R, 0, qwstpad.BTN_A):
+        matched |= combos.update(buttons)
+        ticks.advance(100)
+    assert matched == dash
+
+    # Too slow between presses
+    for buttons in (0, qwstpad.BTN_R, 0, qwstpad.BTN_R, 0):
+        assert combos.update(buttons) == 0
+        ticks.advance(100)
+    ticks.advance(200)
+    assert combos.update(qwstpad.BTN_A) == 0
+
+    # A wrong press starts again
+    for buttons in (0, qwstpad.BTN_R, 0, qwstpad.BTN_L, 0, qwstpad.BTN_R):
+        combos.update(buttons)
+    assert combos.update(qwstpad.BTN_A) == 0
+
+
+def test_invalid(micropython):
+    from qwstpad_combo import ComboMatcher
+
+    combos = ComboMatcher()
+    with pytest.raises(ValueError):
+        combos.add_sequence(())
+    with pytest.raises(ValueError):
+        combos.add_chord(0x400)
+    for _ in range(16):
+        combos.add_chord(1)
+    with pytest.raises(ValueError):
+        combos.add_chord(1)
@@ -0,0 +1,54 @@
+def test_debounce(i2c, ticks, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c)
+    pad.set_debounce(20)
+    address = qwstpad.DEFAULT_ADDRESS
+
+    # A bounce shorter than the window is ignored
+    i2c.press(address, 0xE)
+    assert pad.read_buttons_mask() == 0
+    ticks.advance(10)
+    i2c.press(address)
+    assert pad.read_buttons_mask() == 0
+
+    # A press held for the whole window is accepted, and reported once
+    i2c.press(address, 0xE)
+    pad.read_buttons_mask()
+    ticks.advance(19)
+    assert pad.read_buttons_mask() == 0
+    ticks.advance(1)
+    assert pad.read_buttons_mask() == qwstpad.BTN_A
+    assert pad.just_pressed() == qwstpad.BTN_A
+    ticks.advance(1)
+    pad.read_buttons_mask()
+    assert pad.just_pressed() == 0
+
+
+def test_debounce_per_button(i2c, ticks, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c)
+    pad.set_debounce(50, qwstpad.BTN_U)
+    i2c.press(qwstpad.DEFAULT_ADDRESS, 0xE, 0x1)
+    assert pad.read_buttons_mask() == qwstpad.BTN_A
+    ticks.advance(50)
+    assert pad.read_buttons_mask() == qwstpad.BTN_A | qwstpad.BTN_U
+
+
+def test_repeat(i2c, ticks, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c)
+    pad.set_repeat(300, 100)
+
+    i2c.press(qwstpad.DEFAULT_ADDRESS, 0x3)
+    fired = []
+    for _ in range(60):
+        pad.read_buttons_mask()
+        if pad.repeated() & qwstpad.BTN_R:
+            fired.append(ticks.ms)
+        ticks.advance(10)
+
+    assert fired == [0, 300, 400, 500]
+
+    i2c.press(qwstpad.DEFAULT_ADDRESS)
+    pad.read_buttons_mask()
+    assert pad.repeated() == 0
@@ -0,0 +1,37 @@
+def test_direction(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c)
+
+    assert pad.direction() == qwstpad.DIR_NONE
+    i2c.press(qwstpad.DEFAULT_ADDRESS, 0x1, 0x3)
+    pad.read_buttons_mask()
+    assert pad.direction() == qwstpad.DIR_UP_RIGHT
+    assert pad.vector() == (1, -1)
+
+    assert pad.direction(qwstpad.BTN_D | qwstpad.BTN_L | qwstpad.BTN_A) == qwstpad.DIR_DOWN_LEFT
+    assert pad.vector(qwstpad.BTN_L) == (-1, 0)
+
+
+def test_opposing_directions(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c)
+    up_down_left = qwstpad.BTN_U | qwstpad.BTN_D | qwstpad.BTN_L
+
+    assert pad.direction(up_down_left) == qwstpad.DIR_LEFT
+    assert pad.direction(qwstpad.BTN_L | qwstpad.BTN_R) == qwstpad.DIR_NONE
+
+    pad.set_directions(cancel=False)
+    assert pad.direction(up_down_left) == qwstpad.DIR_UP_LEFT
+    assert pad.direction(qwstpad.BTN_L | qwstpad.BTN_R) == qwstpad.DIR_LEFT
+
+
+def test_four_way(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c)
+    pad.set_directions(diagonals=False)
+
+    assert pad.direction(qwstpad.BTN_U | qwstpad.BTN_R) == qwstpad.DIR_UP
+    assert pad.direction(qwstpad.BTN_R) == qwstpad.DIR_RIGHT
+    for dpad in range(16):
+        assert pad.direction(dpad << 4) not in (qwstpad.DIR_UP_RIGHT, qwstpad.DIR_DOWN_RIGHT,
+                                                qwstpad.DIR_DOWN_LEFT, qwstpad.DIR_UP_LEFT)
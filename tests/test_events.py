@@ -0,0 +1,50 @@
+def test_events(i2c, ticks, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c)
+    pad.enable_events(8)
+    address = qwstpad.DEFAULT_ADDRESS
+
+    i2c.press(address, 0xE)
+    pad.read_buttons_mask()
+    ticks.advance(5)
+    i2c.press(address, 0x1)
+    pad.read_buttons_mask()
+    ticks.advance(5)
+    pad.read_buttons_mask()
+
+    assert pad.events_pending() == 3
+    assert pad.read_event() == (qwstpad.BTN_A, True, 0)
+    assert pad.read_event() == (qwstpad.BTN_A, False, 5)
+    assert pad.read_event() == (qwstpad.BTN_U, True, 5)
+    assert pad.read_event() is None
+    assert pad.events_pending() == 0
+
+
+def test_events_overflow(i2c, ticks, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c)
+    pad.enable_events(4)
+
+    for _ in range(3):
+        i2c.press(qwstpad.DEFAULT_ADDRESS, 0xE)
+        pad.read_buttons_mask()
+        i2c.press(qwstpad.DEFAULT_ADDRESS)
+        pad.read_buttons_mask()
+
+    assert pad.events_pending() == 4
+    assert pad.event_overflows() == 2
+    assert [pad.read_event()[1] for _ in range(4)] == [True, False, True, False]
+
+    # Draining makes room for new events
+    i2c.press(qwstpad.DEFAULT_ADDRESS, 0x5)
+    pad.read_buttons_mask()
+    assert pad.read_event() == (qwstpad.BTN_MINUS, True, 0)
+
+
+def test_events_disabled(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c)
+    i2c.press(qwstpad.DEFAULT_ADDRESS, 0xE)
+    pad.read_buttons_mask()
+    assert pad.events_pending() == 0
+    assert pad.read_event() is None
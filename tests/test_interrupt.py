@@ -0,0 +1,39 @@
+import pytest
+
+
+def test_interrupt_skips_reads(i2c, pin, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c, interrupt=pin)
+    i2c.device(qwstpad.DEFAULT_ADDRESS).interrupt = pin
+    assert pin.trigger == pin.IRQ_FALLING
+
+    reads = i2c.reads
+    assert pad.read_buttons_mask() == 0
+    assert i2c.reads == reads + 1
+
+    for _ in range(10):
+        pad.read_buttons()
+    assert i2c.reads == reads + 1
+
+    i2c.press(qwstpad.DEFAULT_ADDRESS, 0xD)
+    assert pad.read_buttons_mask() == qwstpad.BTN_Y
+    assert pad.just_pressed() == qwstpad.BTN_Y
+    assert pad.read_buttons_mask() == qwstpad.BTN_Y
+    assert pad.just_pressed() == 0
+    assert pad.held() == qwstpad.BTN_Y
+    assert i2c.reads == reads + 2
+
+
+def test_interrupt_failed_read_retries(i2c, pin, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c, interrupt=pin)
+    i2c.device(qwstpad.DEFAULT_ADDRESS).interrupt = pin
+
+    i2c.disconnect(qwstpad.DEFAULT_ADDRESS)
+    with pytest.raises(OSError):
+        pad.read_buttons_mask()
+
+    i2c.connect(qwstpad.DEFAULT_ADDRESS)
+    reads = i2c.reads
+    pad.read_buttons_mask()
+    assert i2c.reads == reads + 1
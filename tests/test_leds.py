@@ -0,0 +1,38 @@
+def test_set_leds(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c, show_address=False)
+    pad.set_leds(0b0101)
+    assert i2c.device(qwstpad.DEFAULT_ADDRESS).register(qwstpad.QwSTPad.OUTPUT_PORT0) == 0b00000100_10000000
+    pad.set_led(2, True)
+    assert i2c.device(qwstpad.DEFAULT_ADDRESS).register(qwstpad.QwSTPad.OUTPUT_PORT0) == 0b00000100_00000000
+    pad.clear_leds()
+    assert i2c.device(qwstpad.DEFAULT_ADDRESS).register(qwstpad.QwSTPad.OUTPUT_PORT0) == 0b00000110_11000000
+
+
+def test_redundant_writes_elided(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c)
+    writes = i2c.writes
+
+    for _ in range(10):
+        pad.set_leds(pad.address_code())
+    pad.set_led(1, True)
+    pad.clear_leds()
+    assert i2c.writes == writes + 1
+    assert pad.elided_writes() == 11
+
+    pad.clear_leds(force=True)
+    assert i2c.writes == writes + 2
+    assert pad.elided_writes() == 11
+
+
+def test_set_leds_all_states(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c, show_address=False)
+    for states in range(16):
+        pad.set_leds(states, force=True)
+        expected = 0
+        for i, pin in enumerate(qwstpad.QwSTPad.LED_MAPPING):
+            if not states & (1 << i):
+                expected |= 1 << pin
+        assert i2c.device(qwstpad.DEFAULT_ADDRESS).register(qwstpad.QwSTPad.OUTPUT_PORT0) == expected
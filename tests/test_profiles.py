@@ -0,0 +1,46 @@
+import pytest
+
+
+def test_profile(i2c, micropython):
+    import qwstpad
+    from qwstpad import BTN_A, BTN_B, BTN_D, BTN_L, BTN_R, BTN_U, Profile
+
+    # Turned a quarter to the right, with A and B both firing
+    FIRE = BTN_A
+    rotated = Profile({BTN_U: BTN_L, BTN_R: BTN_U, BTN_D: BTN_R, BTN_L: BTN_D, FIRE: BTN_A | BTN_B})
+
+    pad = qwstpad.QwSTPad(i2c)
+    pad.set_profile(rotated)
+    i2c.press(qwstpad.DEFAULT_ADDRESS, 0x2, 0xC)    # L and B
+    assert pad.read_buttons_mask() == BTN_U | FIRE
+    i2c.press(qwstpad.DEFAULT_ADDRESS, 0xF)         # X passes through
+    assert pad.read_buttons_mask() == qwstpad.BTN_X
+
+    pad.set_profile()
+    i2c.press(qwstpad.DEFAULT_ADDRESS, 0x2, 0xC)
+    assert pad.read_buttons_mask() == BTN_L | BTN_B
+
+
+def test_profile_without_passthrough(i2c, pin, micropython):
+    import qwstpad
+    from qwstpad import BTN_PLUS, BTN_X, Profile
+
+    pad = qwstpad.QwSTPad(i2c, interrupt=pin)
+    i2c.device(qwstpad.DEFAULT_ADDRESS).interrupt = pin
+    i2c.press(qwstpad.DEFAULT_ADDRESS, 0xF)
+    assert pad.read_buttons_mask() == BTN_X
+
+    # Changing profile rereads the pad, even though no interrupt has fired
+    pad.set_profile(Profile({BTN_PLUS: BTN_X}, passthrough=False))
+    assert pad.read_buttons_mask() == BTN_PLUS
+    i2c.press(qwstpad.DEFAULT_ADDRESS, 0xE)
+    assert pad.read_buttons_mask() == 0
+
+
+def test_invalid_profile(micropython):
+    from qwstpad import BTN_A, Profile
+
+    with pytest.raises(ValueError):
+        Profile({1 << 10: BTN_A})
+    with pytest.raises(ValueError):
+        Profile({BTN_A: 0})
@@ -0,0 +1,167 @@
+import pytest
+
+
+def test_setup_registers(i2c, micropython):
+    import qwstpad
+    qwstpad.QwSTPad(i2c, qwstpad.ALT_ADDRESS_2)
+    device = i2c.device(qwstpad.ALT_ADDRESS_2)
+    assert device.register(qwstpad.QwSTPad.CONFIGURATION_PORT0) == 0b11111001_00111111
+    assert device.register(qwstpad.QwSTPad.POLARITY_PORT0) == 0b11111000_00111110
+    assert device.register(qwstpad.QwSTPad.OUTPUT_PORT0) == 0b00000100_11000000
+
+    # The other pads are left untouched
+    assert i2c.device(qwstpad.DEFAULT_ADDRESS).register(qwstpad.QwSTPad.CONFIGURATION_PORT0) == 0xFFFF
+
+
+def test_transaction_costs(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c)
+    assert (i2c.reads, i2c.writes, i2c.bytes_written) == (0, 3, 6)
+
+    costs = {}
+    for name, call in (("read_buttons", pad.read_buttons),
+                       ("read_buttons_mask", pad.read_buttons_mask),
+                       ("address_code", pad.address_code),
+                       ("set_leds", lambda: pad.set_leds(0b1111)),
+                       ("set_leds_unchanged", lambda: pad.set_leds(0b1111)),
+                       ("set_led", lambda: pad.set_led(1, False)),
+                       ("clear_leds", pad.clear_leds)):
+        i2c.reset_counts()
+        call()
+        costs[name] = (i2c.reads, i2c.writes, i2c.bytes_read + i2c.bytes_written)
+
+    assert costs == {"read_buttons": (1, 0, 2),
+                     "read_buttons_mask": (1, 0, 2),
+                     "address_code": (0, 0, 0),
+                     "set_leds": (0, 1, 2),
+                     "set_leds_unchanged": (0, 0, 0),
+                     "set_led": (0, 1, 2),
+                     "clear_leds": (0, 1, 2)}
+
+
+def test_transaction_log(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c, show_address=False)
+    i2c.reset_counts()
+    pad.read_buttons()
+    pad.set_leds(0b0001)
+    assert i2c.log == [("read", qwstpad.DEFAULT_ADDRESS, qwstpad.QwSTPad.INPUT_PORT0, 2),
+                       ("write", qwstpad.DEFAULT_ADDRESS, qwstpad.QwSTPad.OUTPUT_PORT0, 2)]
+
+
+def test_scripted_buttons(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c)
+    i2c.device(qwstpad.DEFAULT_ADDRESS).script([(0xE,), (0xE, 0xC), (), (0x1,)])
+    masks = [pad.read_buttons_mask() for _ in range(5)]
+    assert masks == [qwstpad.BTN_A, qwstpad.BTN_A | qwstpad.BTN_B, 0, qwstpad.BTN_U, qwstpad.BTN_U]
+
+
+def test_errors(i2c, micropython):
+    import qwstpad
+    i2c.disconnect(qwstpad.ALT_ADDRESS_3)
+    with pytest.raises(OSError):
+        qwstpad.QwSTPad(i2c, qwstpad.ALT_ADDRESS_3)
+
+    pad = qwstpad.QwSTPad(i2c)
+    i2c.fail_next()
+    with pytest.raises(OSError):
+        pad.read_buttons()
+    pad.read_buttons()
+
+
+def test_lazy_setup(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c, lazy=True)
+    assert i2c.transactions() == 0
+
+    i2c.press(qwstpad.DEFAULT_ADDRESS, 0xE)
+    assert pad.read_buttons_mask() == qwstpad.BTN_A
+    assert (i2c.reads, i2c.writes) == (1, 3)
+    assert i2c.device(qwstpad.DEFAULT_ADDRESS).register(qwstpad.QwSTPad.OUTPUT_PORT0) == 0b00000110_10000000
+
+
+def test_lazy_setup_leds(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c, lazy=True)
+    pad.set_auto_flush(False)
+    pad.set_leds(0b1111)
+    assert i2c.transactions() == 0
+
+    pad.flush_leds()
+    assert i2c.writes == 3
+    assert i2c.device(qwstpad.DEFAULT_ADDRESS).register(qwstpad.QwSTPad.OUTPUT_PORT0) == 0
+
+
+def test_verify_setup(i2c, micropython):
+    import qwstpad
+    qwstpad.QwSTPad(i2c, verify=True)
+    assert (i2c.reads, i2c.writes) == (3, 3)
+
+    # A pad that is already set up only needs reading
+    i2c.reset_counts()
+    qwstpad.QwSTPad(i2c, verify=True)
+    assert (i2c.reads, i2c.writes) == (3, 0)
+
+    # A different address code only rewrites the output port
+    i2c.reset_counts()
+    qwstpad.QwSTPad(i2c, show_address=False, verify=True)
+    assert (i2c.reads, i2c.writes) == (3, 1)
+
+
+def test_reinit(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c)
+    pad.set_leds(0b0110)
+
+    device = i2c.device(qwstpad.DEFAULT_ADDRESS)
+    device.reset()
+    assert device.register(qwstpad.QwSTPad.CONFIGURATION_PORT0) == 0xFFFF
+
+    i2c.reset_counts()
+    pad.reinit()
+    assert i2c.writes == 3
+    assert device.register(qwstpad.QwSTPad.CONFIGURATION_PORT0) == 0b11111001_00111111
+    assert device.register(qwstpad.QwSTPad.POLARITY_PORT0) == 0b11111000_00111110
+    assert device.register(qwstpad.QwSTPad.OUTPUT_PORT0) == 0b00000100_01000000
+
+
+def test_verify_config(i2c, micropython):
+    import qwstpad
+    pad = qwstpad.QwSTPad(i2c, lazy=True)
+    assert not pad.verify_config()
+
+    pad.set_leds(0b1001)
+    assert pad.verify_config()
+    assert pad.read_config() == qwstpad.Config(0b11111001_00111111, 0b11111000_00111110, 0b00000010_10000000)
+
+    # Only the button pins are inverted, so the input port needs no further inversion
+    i2c.press(qwstpad.DEFAULT_ADDRESS, *qwstpad.QwSTPad.BUTTON_MAPPING.values())
+    assert pad.read_buttons_mask() == qwstpad.BTN_ALL
+
+    i2c.device(qwstpad.DEFAULT_ADDRESS).reset()
+    assert not pad.verify_config()
+    pad.reinit()
+    assert pad.verify_config()
+
+
+def test_python_decode_encode(micropython):
+    import qwstpad
+
+    # CPython has no viper emitter, so the pure Python versions must be in use
+    assert qwstpad._decode is qwstpad._py_decode
+    assert qwstpad._encode is qwstpad._py_encode
+
+    buffer = bytearray(2)
+    qwstpad._py_encode(buffer, 0xF9C0)
+    assert buffer == b"\xc0\xf9"
+
+
+def test_remap_tables(micropython):
+    import qwstpad
+
+    pins = tuple(qwstpad.QwSTPad.BUTTON_MAPPING.values())
+    low, high = qwstpad._build_remap(pins)
+    for value in range(256):
+        assert low[value] == sum(1 << i for i, pin in enumerate(pins) if pin < 8 and value & (1 << pin))
+        assert high[value] == sum(1 << i for i, pin in enumerate(pins) if pin >= 8 and value & (1 << (pin - 8)))
@@ -0,0 +1,88 @@
+import io
+
+import pytest
+
+
+def record(i2c, ticks):
+    import qwstpad
+    from qwstpad_replay import RecordingI2C
+
+    recorder = RecordingI2C(i2c)
+    pads = [qwstpad.QwSTPad(recorder, address) for address in (qwstpad.DEFAULT_ADDRESS, qwstpad.ALT_ADDRESS_1)]
+    for presses in ((), (0xE,), (0xE,), (0xE, 0x1), (), ()):
+        i2c.press(qwstpad.ALT_ADDRESS_1, *presses)
+        for pad in pads:
+            pad.read_buttons_mask()
+        ticks.advance(10)
+    return recorder.recording
+
+
+def test_record_changes_only(i2c, micropython, ticks):
+    recording = record(i2c, ticks)
+
+    # The first read of each pad, then the three changes on the second pad
+    assert len(recording) == 5
+    assert list(recording.pads[:5]) == [0, 1, 1, 1, 1]
+    assert list(recording.times[:5]) == [0, 0, 10, 30, 40]
+
+
+def test_save_load(i2c, micropython, ticks):
+    from qwstpad_replay import Recording
+
+    recording = record(i2c, ticks)
+    file = io.BytesIO()
+    recording.save(file)
+    file.seek(0)
+    loaded = Recording.load(file)
+
+    assert len(loaded) == len(recording)
+    assert list(loaded.times[:len(loaded)]) == list(recording.times[:len(recording)])
+    assert list(loaded.values[:len(loaded)]) == list(recording.values[:len(recording)])
+
+    # Four byte times, one byte pads and two byte values, whatever the platform
+    assert len(file.getvalue()) == 9 + 7 * len(recording)
+
+    with pytest.raises(ValueError):
+        Recording.load(io.BytesIO(b"nonsense!"))
+
+
+def test_load_board_recording(micropython):
+    from qwstpad_replay import Recording
+
+    # Two samples, as saved by a board
+    data = (b"QWSR\x01\x02\x00\x00\x00"
+            b"\x00\x00\x00\x00\x2c\x01\x00\x00"
+            b"\x00\x01"
+            b"\x02\x00\x00\xf8")
+    recording = Recording.load(io.BytesIO(data))
+
+    assert len(recording) == 2
+    assert list(recording.times[:2]) == [0, 300]
+    assert list(recording.pads[:2]) == [0, 1]
+    assert list(recording.values[:2]) == [0x0002, 0xF800]
+
+    with pytest.raises(ValueError):
+        Recording.load(io.BytesIO(data[:-1]))
+
+
+def test_replay(i2c, micropython, ticks):
+    import qwstpad
+    from qwstpad_replay import ReplayI2C
+
+    replay = ReplayI2C(record(i2c, ticks), speed=2)
+    assert replay.scan() == [qwstpad.DEFAULT_ADDRESS, qwstpad.ALT_ADDRESS_1]
+
+    pad = qwstpad.QwSTPad(replay, qwstpad.ALT_ADDRESS_1)
+    masks = []
+    for _ in range(5):
+        masks.append(pad.read_buttons_mask())
+        ticks.advance(5)
+
+    assert masks == [0, qwstpad.BTN_A, qwstpad.BTN_A, qwstpad.BTN_A | qwstpad.BTN_U, 0]
+    assert replay.finished()
+    # LEDs are active low, so only LED 2 of the address code is lit
+    assert replay.output(qwstpad.ALT_ADDRESS_1) == 0b00000110_01000000
+
+    # Pads that were not recorded are not connected
+    with pytest.raises(OSError):
+        qwstpad.QwSTPad(replay, qwstpad.ALT_ADDRESS_2)
@@ -0,0 +1,49 @@
+import pytest
+from tca9555 import FakeI2C
+
+
+class SlowI2C(FakeI2C):
+    # Takes 1ms per read and 2ms per write on the fake clock
+    def __init__(self, ticks):
+        super().__init__()
+        self.ticks = ticks
+
+    def readfrom_mem_into(self, address, reg, buf, addrsize=8):
+        self.ticks.advance(1)
+        super().readfrom_mem_into(address, reg, buf)
+
+    def writeto_mem(self, address, reg, buf, addrsize=8):
+        self.ticks.advance(2)
+        super().writeto_mem(address, reg, buf)
+
+
+def test_stats(ticks, micropython):
+    import qwstpad
+    i2c = SlowI2C(ticks)
+    pad = qwstpad.QwSTPad(i2c, stats=True)
+    assert pad.stats() == (0, 3, 0, 0, 2000, 2000, 2000)
+
+    pad.reset_stats()
+    for _ in range(3):
+        pad.read_buttons()
+    pad.set_leds(pad.address_code())
+    pad.clear_leds()
+
+    stats = pad.stats()
+    assert stats == (3, 1, 1, 0, 1000, 2000, 1250)
+    assert stats.reads == 3
+    assert stats.avg_us == 1250
+
+    i2c.disconnect(qwstpad.DEFAULT_ADDRESS)
+    with pytest.raises(OSError):
+        pad.read_buttons()
+    assert pad.stats().errors == 1
+
+
+def test_stats_disabled(ticks, micropython):
+    import qwstpad
+    i2c = SlowI2C(ticks)
+    pad = qwstpad.QwSTPad(i2c)
+    pad.read_buttons()
+    pad.set_leds(pad.address_code())
+    assert pad.stats() == (0, 0, 1, 0, 0, 0, 0)
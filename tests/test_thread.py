@@ -0,0 +1,53 @@
+import time
+
+import pytest
+
+
+def wait_for(condition):
+    deadline = time.monotonic() + 2
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_sampler(i2c, micropython):
+    import qwstpad
+    from qwstpad_thread import ThreadedQwSTPad
+
+    pad = qwstpad.QwSTPad(i2c)
+    sampler = ThreadedQwSTPad(pad, poll_ms=1)
+    sampler.start()
+    try:
+        # A tap between two reads is still seen, as presses and releases are gathered until read
+        reads = i2c.reads
+        i2c.press(qwstpad.DEFAULT_ADDRESS, 0xE)
+        wait_for(lambda: i2c.reads > reads + 2)
+        reads = i2c.reads
+        i2c.press(qwstpad.DEFAULT_ADDRESS)
+        wait_for(lambda: i2c.reads > reads + 2)
+
+        assert sampler.read_buttons_mask() == 0
+        assert sampler.just_pressed() == qwstpad.BTN_A
+        assert sampler.just_released() == qwstpad.BTN_A
+
+        sampler.set_leds(0b1111)
+        sampler.read_buttons_mask()
+        assert sampler.just_pressed() == 0
+    finally:
+        sampler.stop()
+
+    assert not sampler.running()
+    assert i2c.device(qwstpad.DEFAULT_ADDRESS).register(qwstpad.QwSTPad.OUTPUT_PORT0) == 0
+
+
+def test_sampler_disconnect(i2c, micropython):
+    import qwstpad
+    from qwstpad_thread import ThreadedQwSTPad
+
+    sampler = ThreadedQwSTPad(qwstpad.QwSTPad(i2c), poll_ms=1)
+    sampler.start()
+    i2c.disconnect(qwstpad.DEFAULT_ADDRESS)
+    wait_for(lambda: not sampler.running())
+
+    with pytest.raises(OSError):
+        sampler.read_buttons_mask()
@@ -2,6 +2,7 @@
 
 import argparse
 import json
+import subprocess
 from pathlib import Path
 
 
@@ -16,10 +17,36 @@ parser = argparse.ArgumentParser()
 
 parser.add_argument("-r", "--repo", type=repo_url)
 parser.add_argument("-v", "--ver")
+parser.add_argument("--mpy", type=Path, help="compile to .mpy in this directory, with its own package.json")
+parser.add_argument("--march", default="armv6m", help="architecture for modules with native code, passed to mpy-cross")
+parser.add_argument("--mpy-cross", default="mpy-cross", help="the mpy-cross executable to use")
 parser.add_argument("root", type=Path)
 
 args = parser.parse_args()
 
+if args.mpy:
+    # Precompiled files are listed relative to their package.json, so the
+    # directory can be installed with mip from wherever it is published
+    data = {
+        "version": args.ver,
+        "urls": [],
+    }
+    for path in sorted(args.root.rglob("*.py")):
+        relpath = path.relative_to(args.root).with_suffix(".mpy")
+        output = args.mpy / relpath
+        output.parent.mkdir(parents=True, exist_ok=True)
+        # Only modules with native code are tied to an architecture, so the rest stay portable
+        command = [args.mpy_cross, "-o", str(output), str(path)]
+        if "@micropython.native" in path.read_text() or "@micropython.viper" in path.read_text():
+            command.insert(1, f"-march={args.march}")
+        print(f"Compiling {path} to {output}")
+        subprocess.run(command, check=True)
+        data["urls"].append([str(relpath), str(relpath)])
+
+    with open(args.mpy / "package.json", "w") as f:
+        f.write(json.dumps(data, indent=True))
+    raise SystemExit
+
 try:
     data = json.load(open("package.json", "r"))
     print("package.json found: updating!")